@@ -0,0 +1,53 @@
+"""
+Shared HTTP client for outbound Slack API calls.
+
+A single aiohttp session is reused across requests so connections to
+slack.com are kept alive instead of paying a new TLS handshake per call.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Connection pool and timeout settings for Slack API calls
+HTTP_TIMEOUT_SECONDS = 10
+HTTP_MAX_CONNECTIONS = 100
+
+# Global session instance (created lazily inside the running event loop)
+_http_session: Optional[aiohttp.ClientSession] = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get the shared aiohttp session, creating it on first use."""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_SECONDS),
+            connector=aiohttp.TCPConnector(limit=HTTP_MAX_CONNECTIONS),
+            # Slack API calls are authenticated by token, never by cookie
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+        logger.debug("Created shared HTTP session")
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """Close the shared aiohttp session, if one was created."""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+        logger.debug("Closed shared HTTP session")
+    _http_session = None
+
+
+@asynccontextmanager
+async def http_session_lifespan(server) -> AsyncIterator[Any]:
+    """Server lifespan that closes the shared HTTP session on shutdown."""
+    try:
+        yield {}
+    finally:
+        await close_http_session()
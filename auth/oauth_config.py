@@ -3,6 +3,7 @@ OAuth Configuration Management for Slack MCP server.
 Handles OAuth 2.0 configuration (tokens managed by session_store).
 """
 
+import functools
 import os
 from urllib.parse import quote, urlparse
 
@@ -71,32 +72,31 @@ class SlackOAuthConfig:
         Args:
             state: Optional state parameter to pass through OAuth flow (e.g., session ID)
         """
-        user_scopes = ",".join(self.scopes)
-        url = (
-            f"https://slack.com/oauth/v2/authorize"
-            f"?client_id={quote(self.client_id, safe='')}"
-            f"&user_scope={quote(user_scopes, safe='')}"
-            f"&redirect_uri={quote(self.redirect_uri, safe='')}"
-        )
+        url = _build_base_url(self.client_id, ",".join(self.scopes), self.redirect_uri)
         if state:
             url += f"&state={quote(state, safe='')}"
         return url
 
 
-# Global configuration instance
-_oauth_config = None
+@functools.lru_cache(maxsize=8)
+def _build_base_url(client_id: str, user_scopes: str, redirect_uri: str) -> str:
+    """Build the authorization URL without state, quoting each parameter once."""
+    return (
+        f"https://slack.com/oauth/v2/authorize"
+        f"?client_id={quote(client_id, safe='')}"
+        f"&user_scope={quote(user_scopes, safe='')}"
+        f"&redirect_uri={quote(redirect_uri, safe='')}"
+    )
 
 
+@functools.lru_cache(maxsize=1)
 def get_oauth_config() -> SlackOAuthConfig:
     """Get the global OAuth configuration instance."""
-    global _oauth_config
-    if _oauth_config is None:
-        _oauth_config = SlackOAuthConfig()
-    return _oauth_config
+    return SlackOAuthConfig()
 
 
 def reload_oauth_config() -> SlackOAuthConfig:
     """Reload the OAuth configuration from environment variables."""
-    global _oauth_config
-    _oauth_config = SlackOAuthConfig()
-    return _oauth_config
+    get_oauth_config.cache_clear()
+    _build_base_url.cache_clear()
+    return get_oauth_config()
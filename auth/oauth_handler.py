@@ -6,15 +6,27 @@ Manages the OAuth flow and token exchange with session binding.
 import logging
 from typing import Optional, Tuple
 
-import aiohttp
-from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from slack_sdk.http_retry.builtin_async_handlers import (
+    AsyncConnectionErrorRetryHandler,
+    AsyncRateLimitErrorRetryHandler,
+)
+from slack_sdk.web.async_client import AsyncWebClient
 
 from auth import context
+from auth.http_client import get_http_session
+from auth.oauth_config import get_oauth_config
 from auth.session_store import get_session_store
 
 logger = logging.getLogger(__name__)
 
+# Retry transient connection errors and rate-limited (HTTP 429) responses,
+# so one throttled page doesn't fail a whole paginated walk
+_RETRY_HANDLERS = [
+    AsyncConnectionErrorRetryHandler(),
+    AsyncRateLimitErrorRetryHandler(max_retry_count=2),
+]
+
 
 async def exchange_code_for_token(code: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
@@ -26,71 +38,76 @@ async def exchange_code_for_token(code: str) -> Tuple[Optional[str], Optional[st
     Returns:
         Tuple of (access_token, user_id, error_message)
     """
-    from auth.oauth_config import get_oauth_config
-
     config = get_oauth_config()
 
     if not config.is_configured():
         return None, None, "OAuth not configured: Missing client_id or client_secret"
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                "https://slack.com/api/oauth.v2.access",
-                data={
-                    "client_id": config.client_id,
-                    "client_secret": config.client_secret,
-                    "code": code,
-                    "redirect_uri": config.redirect_uri,
-                },
-            ) as response:
-                data = await response.json()
-
-                if not data.get("ok"):
-                    error_msg = data.get("error", "Unknown error")
-                    logger.error(f"OAuth token exchange failed: {error_msg}")
-                    return None, None, f"Token exchange failed: {error_msg}"
-
-                # Extract user token and user_id
-                access_token = data.get("authed_user", {}).get("access_token")
-                user_id = data.get("authed_user", {}).get("id")
-
-                if not access_token or not user_id:
-                    logger.error("Missing access_token or user_id in OAuth response")
-                    return None, None, "Invalid OAuth response"
-
-                # Get session ID from context (if available)
-                session_id = context.fastmcp_session_id.get()
-
-                # Store the token with session binding
-                store = get_session_store()
-                try:
-                    store.store_user_token(user_id, access_token, session_id)
+        session = get_http_session()
+        async with session.post(
+            "https://slack.com/api/oauth.v2.access",
+            data={
+                "client_id": config.client_id,
+                "client_secret": config.client_secret,
+                "code": code,
+                "redirect_uri": config.redirect_uri,
+            },
+        ) as response:
+            data = await response.json()
+
+            if not data.get("ok"):
+                error_msg = data.get("error", "Unknown error")
+                logger.error("OAuth token exchange failed: %s", error_msg)
+                return None, None, f"Token exchange failed: {error_msg}"
+
+            # Extract user token and user_id
+            access_token = data.get("authed_user", {}).get("access_token")
+            user_id = data.get("authed_user", {}).get("id")
+
+            if not access_token or not user_id:
+                logger.error("Missing access_token or user_id in OAuth response")
+                return None, None, "Invalid OAuth response"
+
+            # Get session ID from context (if available)
+            session_id = context.fastmcp_session_id.get()
+
+            # Store the token with session binding
+            store = get_session_store()
+            try:
+                store.store_user_token(user_id, access_token, session_id)
+                if session_id:
                     logger.info(
-                        f"Successfully authenticated user {user_id}"
-                        + (f" and bound to session {session_id}" if session_id else "")
+                        "Successfully authenticated user %s and bound to session %s",
+                        user_id,
+                        session_id,
                     )
-                except ValueError as e:
-                    # Session binding conflict
-                    logger.error(f"Session binding error: {e}")
-                    return None, None, str(e)
+                else:
+                    logger.info("Successfully authenticated user %s", user_id)
+            except ValueError as e:
+                # Session binding conflict
+                logger.error("Session binding error: %s", e)
+                return None, None, str(e)
 
-                return access_token, user_id, None
+            return access_token, user_id, None
 
     except Exception as e:
-        logger.error(f"Error during token exchange: {e}")
+        logger.error("Error during token exchange: %s", e)
         return None, None, f"Exception during token exchange: {e!s}"
 
 
-def get_slack_client_for_session() -> Optional[WebClient]:
+def get_slack_client_for_session() -> Optional[AsyncWebClient]:
     """
-    Get a Slack WebClient for the current authenticated session.
+    Get an async Slack client for the current authenticated session.
 
     This function uses the session context to securely retrieve the
     appropriate user's token without requiring user_id as a parameter.
 
+    The client reuses the shared HTTP session so connections to Slack
+    are kept alive across tool calls, and retries rate-limited requests.
+
     Returns:
-        WebClient instance or None if user not authenticated
+        AsyncWebClient instance or None if user not authenticated
     """
     user_id = context.authenticated_user_id.get()
     session_id = context.fastmcp_session_id.get()
@@ -104,13 +121,17 @@ def get_slack_client_for_session() -> Optional[WebClient]:
     token = store.get_user_token_with_validation(user_id, session_id)
 
     if not token:
-        logger.warning(f"No valid token found for user {user_id} in session {session_id}")
+        logger.warning("No valid token found for user %s in session %s", user_id, session_id)
         return None
 
-    return WebClient(token=token)
+    return AsyncWebClient(
+        token=token,
+        session=get_http_session(),
+        retry_handlers=_RETRY_HANDLERS,
+    )
 
 
-def validate_session_token() -> Tuple[bool, Optional[str]]:
+async def validate_session_token() -> Tuple[bool, Optional[str]]:
     """
     Validate that the current session has a valid token.
 
@@ -128,7 +149,7 @@ def validate_session_token() -> Tuple[bool, Optional[str]]:
 
     # Test the token by calling auth.test
     try:
-        response = client.auth_test()
+        response = await client.auth_test()
         if response.get("ok"):
             return True, None
         else:
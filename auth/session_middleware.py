@@ -3,34 +3,49 @@ Session middleware for Slack MCP.
 
 This middleware intercepts MCP requests and extracts session information,
 making it available to tool functions via context variables.
+
+Implemented as a pure ASGI middleware (rather than Starlette's
+BaseHTTPMiddleware) so requests are passed straight through to the wrapped
+app without an extra task hop or response body buffering.
 """
 
 import logging
-from typing import Any, Callable
+from typing import Optional
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from auth import context
 from auth.session_store import get_session_store
 
 logger = logging.getLogger(__name__)
 
+# Header names (lowercase, as delivered in the ASGI scope) that may carry the session ID
+_SESSION_HEADERS = (b"mcp-session-id", b"x-session-id")
+
 
-class SlackSessionMiddleware(BaseHTTPMiddleware):
+class SlackSessionMiddleware:
     """
     Middleware that extracts session information from requests and makes it
     available to MCP tool functions via context variables.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Any:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and set session context."""
-        logger.debug(f"SlackSessionMiddleware processing: {request.method} {request.url.path}")
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        path = scope.get("path", "")
+        logger.debug("SlackSessionMiddleware processing: %s %s", scope.get("method"), path)
 
         # Skip non-MCP paths (but allow OAuth callback)
-        if not (request.url.path.startswith("/mcp") or request.url.path == "/oauth2callback"):
-            logger.debug(f"Skipping non-MCP path: {request.url.path}")
-            return await call_next(request)
+        if not (path.startswith("/mcp") or path == "/oauth2callback"):
+            logger.debug("Skipping non-MCP path: %s", path)
+            await self.app(scope, receive, send)
+            return
 
         try:
             # Extract session information
@@ -38,42 +53,47 @@ class SlackSessionMiddleware(BaseHTTPMiddleware):
             user_id = None
 
             # Check for FastMCP session ID (from streamable HTTP transport)
-            if hasattr(request.state, "session_id"):
-                session_id = request.state.session_id
-                logger.debug(f"Found FastMCP session ID: {session_id}")
+            state = scope.get("state")
+            if state:
+                session_id = state.get("session_id")
+                if session_id:
+                    logger.debug("Found FastMCP session ID: %s", session_id)
 
             # If no session from FastMCP, try headers
             if not session_id:
-                headers = dict(request.headers)
-                session_id = (
-                    headers.get("mcp-session-id")
-                    or headers.get("Mcp-Session-Id")
-                    or headers.get("x-session-id")
-                    or headers.get("X-Session-ID")
-                )
+                session_id = _get_session_header(scope)
                 if session_id:
-                    logger.debug(f"Found session ID in headers: {session_id}")
+                    logger.debug("Found session ID in headers: %s", session_id)
 
             # Look up authenticated user from session binding
             if session_id:
                 store = get_session_store()
                 user_id = store.get_user_by_session(session_id)
                 if user_id:
-                    logger.debug(f"Found authenticated user {user_id} for session {session_id}")
+                    logger.debug("Found authenticated user %s for session %s", user_id, session_id)
 
             # Set context variables for easy access
             if session_id or user_id:
                 logger.debug(
-                    f"MCP request with session: session_id={session_id}, user_id={user_id}"
+                    "MCP request with session: session_id=%s, user_id=%s", session_id, user_id
                 )
                 context.fastmcp_session_id.set(session_id)
                 context.authenticated_user_id.set(user_id)
 
             # Process request
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send)
 
         except Exception as e:
-            logger.error(f"Error in Slack session middleware: {e}", exc_info=True)
+            logger.error("Error in Slack session middleware: %s", e, exc_info=True)
             # Re-raise the exception to avoid duplicate request handling
             raise
+
+
+def _get_session_header(scope: Scope) -> Optional[str]:
+    """Return the session ID from the request headers, if present."""
+    headers = dict(scope.get("headers", ()))
+    for name in _SESSION_HEADERS:
+        value = headers.get(name)
+        if value:
+            return value.decode("latin-1")
+    return None
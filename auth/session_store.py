@@ -61,18 +61,20 @@ class SlackSessionStore:
         with self._lock:
             # Store the token
             self._user_tokens[user_id] = access_token
-            logger.info(f"Stored Slack token for user {user_id}")
+            logger.info("Stored Slack token for user %s", user_id)
 
             # Create immutable session binding if provided
             if session_id:
                 if session_id not in self._session_bindings:
                     self._session_bindings[session_id] = user_id
-                    logger.info(f"Created immutable session binding: {session_id} -> {user_id}")
+                    logger.info("Created immutable session binding: %s -> %s", session_id, user_id)
                 elif self._session_bindings[session_id] != user_id:
                     # Security: Attempt to bind session to different user
                     logger.error(
-                        f"SECURITY: Attempt to rebind session {session_id} from "
-                        f"{self._session_bindings[session_id]} to {user_id}"
+                        "SECURITY: Attempt to rebind session %s from %s to %s",
+                        session_id,
+                        self._session_bindings[session_id],
+                        user_id,
                     )
                     raise ValueError(f"Session {session_id} is already bound to a different user")
 
@@ -101,23 +103,27 @@ class SlackSessionStore:
                 if bound_user:
                     if bound_user != user_id:
                         logger.error(
-                            f"SECURITY VIOLATION: Session {session_id} (bound to {bound_user}) "
-                            f"attempted to access token for {user_id}"
+                            "SECURITY VIOLATION: Session %s (bound to %s) "
+                            "attempted to access token for %s",
+                            session_id,
+                            bound_user,
+                            user_id,
                         )
                         return None
                     # Session binding matches, allow access
-                    logger.debug(f"Session validation passed for {user_id}")
+                    logger.debug("Session validation passed for %s", user_id)
                     return self._user_tokens.get(user_id)
                 else:
                     # Session not bound yet - this shouldn't happen in normal flow
                     logger.warning(
-                        f"Session {session_id} not bound to any user. "
-                        f"Denying access to {user_id}'s token."
+                        "Session %s not bound to any user. Denying access to %s's token.",
+                        session_id,
+                        user_id,
                     )
                     return None
             else:
                 # No session ID provided - deny access for security
-                logger.warning(f"No session ID provided. Denying access to {user_id}'s token.")
+                logger.warning("No session ID provided. Denying access to %s's token.", user_id)
                 return None
 
     def get_user_by_session(self, session_id: str) -> Optional[str]:
@@ -152,53 +158,36 @@ class SlackSessionStore:
             # Store state with session and timestamp
             self._oauth_states[state] = (session_id, time.time())
 
-            logger.info(f"Generated OAuth state for session {session_id}")
+            logger.info("Generated OAuth state for session %s", session_id)
             return state
 
-    def validate_and_consume_oauth_state(self, state: str, session_id: str) -> bool:
+    def pop_oauth_state(self, state: str) -> Optional[Tuple[str, float]]:
         """
-        Validate OAuth state parameter and consume it (one-time use).
+        Remove and return an OAuth state in a single lock acquisition.
 
-        This prevents CSRF attacks by ensuring:
-        1. The state was generated by us
-        2. The state is bound to the correct session
-        3. The state hasn't expired
-        4. The state can only be used once
+        The state is consumed whether or not it turns out to be valid, so it
+        can never be replayed. Callers check expiry with is_oauth_state_expired.
 
         Args:
             state: OAuth state parameter from callback
-            session_id: Current session ID
 
         Returns:
-            True if state is valid, False otherwise
+            Tuple of (session_id, timestamp) if the state exists, None otherwise
         """
         with self._lock:
-            # Check if state exists
-            if state not in self._oauth_states:
-                logger.error(f"Invalid OAuth state: {state} not found")
-                return False
+            return self._oauth_states.pop(state, None)
 
-            # Get stored session and timestamp
-            stored_session, timestamp = self._oauth_states[state]
-
-            # Check if state has expired
-            if time.time() - timestamp > self._state_expiry_seconds:
-                logger.error(f"OAuth state expired: {state}")
-                del self._oauth_states[state]
-                return False
+    def is_oauth_state_expired(self, timestamp: float) -> bool:
+        """
+        Check whether an OAuth state created at the given time has expired.
 
-            # Check if state is bound to the correct session
-            if stored_session != session_id:
-                logger.error(
-                    f"SECURITY: OAuth state {state} bound to session {stored_session} "
-                    f"but used with session {session_id}"
-                )
-                return False
+        Args:
+            timestamp: Creation time returned by pop_oauth_state
 
-            # State is valid - consume it (delete for one-time use)
-            del self._oauth_states[state]
-            logger.info(f"OAuth state validated and consumed for session {session_id}")
-            return True
+        Returns:
+            True if the state is older than the expiry window
+        """
+        return time.time() - timestamp > self._state_expiry_seconds
 
     def cleanup_expired_states(self) -> None:
         """Remove expired OAuth states."""
@@ -212,7 +201,7 @@ class SlackSessionStore:
             for state in expired:
                 del self._oauth_states[state]
             if expired:
-                logger.info(f"Cleaned up {len(expired)} expired OAuth states")
+                logger.info("Cleaned up %s expired OAuth states", len(expired))
 
 
 # Global instance
@@ -6,71 +6,150 @@ Main entry point for the Slack Model Context Protocol server.
 Features secure multi-user authentication with session-based access control.
 """
 
+import asyncio
+import html
 import logging
 import os
 import sys
+import textwrap
 from importlib import metadata
+from string import Template
+from typing import Annotated, Literal, Optional
 
+import orjson
 import slack_tools
 from auth import context
+from auth.http_client import http_session_lifespan
 from auth.oauth_config import get_oauth_config, reload_oauth_config
 from auth.oauth_handler import exchange_code_for_token
 from auth.session_middleware import SlackSessionMiddleware
+from auth.session_store import get_session_store
 from fastapi import Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, Response
 from fastmcp import FastMCP
-from fastmcp.server.dependencies import get_context
+from pydantic import Field
 from starlette.middleware import Middleware
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# Skip collecting record fields the log format never uses
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.raiseExceptions = False
+
+# Configure the root logger (same behavior as basicConfig: only if not already configured)
+if not logging.root.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    logging.root.addHandler(_log_handler)
+    logging.root.setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    __version__ = metadata.version("slack-mcp")
+except metadata.PackageNotFoundError:
+    __version__ = "dev"
+
 # Reload OAuth config
 reload_oauth_config()
 
-# Initialize FastMCP server with session middleware
+# Health check response body, serialized once
+_HEALTH_JSON = b'{"status":"healthy"}'
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_JSON)).encode()),
+]
+
+
+class HealthCheckMiddleware:
+    """
+    Pure ASGI middleware answering GET /health for the ECS load balancer.
+
+    Health probes are answered before routing and the session middleware,
+    with a precomputed response body.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] != "/health"
+            or scope["method"] not in ("GET", "HEAD")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        await send({"type": "http.response.start", "status": 200, "headers": _HEALTH_HEADERS})
+        body = _HEALTH_JSON if scope["method"] == "GET" else b""
+        await send({"type": "http.response.body", "body": body})
+
+
+# Initialize FastMCP server with health check and session middleware
+health_middleware = Middleware(HealthCheckMiddleware)
 session_middleware = Middleware(SlackSessionMiddleware)
 
 
 class SecureFastMCP(FastMCP):
     """Custom FastMCP with session middleware for secure authentication."""
 
-    def streamable_http_app(self):
-        """Override to add secure middleware stack."""
-        app = super().streamable_http_app()
-
-        # Add session middleware
-        app.user_middleware.insert(0, session_middleware)
-
-        # Rebuild middleware stack
-        app.middleware_stack = app.build_middleware_stack()
+    def http_app(self, *args, middleware=None, **kwargs):
+        """Override to add secure middleware stack at app construction time."""
+        # Health checks are answered first, then session middleware wraps everything else
+        middleware = [health_middleware, session_middleware, *(middleware or [])]
+        app = super().http_app(*args, middleware=middleware, **kwargs)
         logger.info("Added SlackSessionMiddleware for secure authentication")
         return app
 
 
-server = SecureFastMCP("Slack MCP Server")
+def serialize_tool_result(data) -> str:
+    """Serialize tool results to JSON with orjson (Slack payloads can be hundreds of KB)."""
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+server = SecureFastMCP(
+    "Slack MCP Server",
+    lifespan=http_session_lifespan,
+    tool_serializer=serialize_tool_result,
+)
+
+# Strong references to fire-and-forget tasks so they aren't garbage collected
+_background_tasks = set()
+
+
+# Only print to stderr when attached to a terminal; in MCP mode stderr may be
+# captured by the client, so output is routed through the logger instead
+_PRINT_ENABLED = sys.stderr.isatty()
+
+
+# Shared parameter types for tool schemas (validated by pydantic before the tool runs)
+# Tools default to 100 items so existing clients get the same response size;
+# larger limits (up to MAX_PAGE_SIZE) are filled across pages by _collect_pages
+PageLimit = Annotated[int, Field(ge=1, le=1000)]
+PageCursor = Annotated[Optional[str], Field(max_length=4096)]
 
 
 def safe_print(text):
     """Print to stderr safely, avoiding JSON parsing errors in MCP mode."""
-    if not sys.stderr.isatty():
-        logger.debug(f"[MCP Server] {text}")
+    if not _PRINT_ENABLED:
+        logger.debug("[MCP Server] %s", text)
         return
 
     try:
-        print(text, file=sys.stderr)
+        sys.stderr.write(f"{text}\n")
     except UnicodeEncodeError:
-        print(text.encode("ascii", errors="replace").decode(), file=sys.stderr)
+        sys.stderr.write(f"{text.encode('ascii', errors='replace').decode()}\n")
+    sys.stderr.flush()
 
 
 @server.tool()
-def slack_get_channel_messages(
+async def slack_get_channel_messages(
     channel_id: str,
-    limit: int = 100,
-    cursor: str = None,
+    limit: PageLimit = 100,
+    cursor: PageCursor = None,
 ) -> dict:
     """
     Get messages from a Slack channel.
@@ -86,15 +165,15 @@ def slack_get_channel_messages(
     Returns:
         Dictionary with messages and pagination info
     """
-    return slack_tools.get_channel_messages(channel_id, limit, cursor)
+    return await slack_tools.get_channel_messages(channel_id, limit, cursor)
 
 
 @server.tool()
-def slack_get_thread_replies(
+async def slack_get_thread_replies(
     channel_id: str,
     thread_ts: str,
-    limit: int = 100,
-    cursor: str = None,
+    limit: PageLimit = 100,
+    cursor: PageCursor = None,
 ) -> dict:
     """
     Get replies from a Slack thread.
@@ -111,20 +190,20 @@ def slack_get_thread_replies(
     Returns:
         Dictionary with thread messages and pagination info
     """
-    return slack_tools.get_thread_replies(channel_id, thread_ts, limit, cursor)
+    return await slack_tools.get_thread_replies(channel_id, thread_ts, limit, cursor)
 
 
 @server.tool()
-def slack_search_messages(
+async def slack_search_messages(
     query: str,
-    count: int = 20,
-    page: int = 1,
+    count: Annotated[int, Field(ge=1, le=100)] = 20,
+    page: Annotated[int, Field(ge=1)] = 1,
     from_user: str = None,
     in_channel: str = None,
     after_date: str = None,
     before_date: str = None,
-    sort_by: str = "relevance",
-    sort_order: str = "desc",
+    sort_by: Literal["timestamp", "relevance"] = "relevance",
+    sort_order: Literal["asc", "desc"] = "desc",
 ) -> dict:
     """
     Search for messages across all Slack conversations with advanced filters.
@@ -151,7 +230,7 @@ def slack_search_messages(
         - Search from user in channel: slack_search_messages("meeting", from_user="@john", in_channel="#team")
         - Date range: slack_search_messages("report", after_date="2025-01-01", before_date="2025-01-31")
     """
-    return slack_tools.search_messages(
+    return await slack_tools.search_messages(
         query=query,
         count=count,
         page=page,
@@ -165,10 +244,11 @@ def slack_search_messages(
 
 
 @server.tool()
-def slack_get_users(
+async def slack_get_users(
     user_id: str = None,
-    limit: int = 100,
-    cursor: str = None,
+    limit: PageLimit = 100,
+    cursor: PageCursor = None,
+    force_refresh: bool = False,
 ) -> dict:
     """
     Get users from Slack workspace.
@@ -184,22 +264,24 @@ def slack_get_users(
         user_id: Optional user ID. If provided, gets specific user profile
         limit: Maximum number of users to retrieve when listing (default: 100, max: 1000)
         cursor: Pagination cursor from previous response (for listing mode)
+        force_refresh: Bypass the cached user list, which is kept for 10 minutes (default: False)
 
     Returns:
         Dictionary with user(s) and pagination info
         - List mode: {"ok": True, "users": [...], "next_cursor": "..."}
         - Get mode: {"ok": True, "user": {...}}
     """
-    return slack_tools.get_users(user_id, limit, cursor)
+    return await slack_tools.get_users(user_id, limit, cursor, force_refresh)
 
 
 @server.tool()
-def slack_get_channels(
+async def slack_get_channels(
     channel_id: str = None,
     types: str = None,
-    limit: int = 100,
-    cursor: str = None,
+    limit: PageLimit = 100,
+    cursor: PageCursor = None,
     include_members: bool = False,
+    force_refresh: bool = False,
 ) -> dict:
     """
     Get channels from Slack workspace.
@@ -218,13 +300,63 @@ def slack_get_channels(
         limit: Maximum number of channels to retrieve when listing (default: 100, max: 1000)
         cursor: Pagination cursor from previous response (for listing mode)
         include_members: Include member list when getting specific channel (default: False)
+        force_refresh: Bypass the cached channel list, which is kept for 10 minutes (default: False)
 
     Returns:
         Dictionary with channel(s) and pagination info
         - List mode: {"ok": True, "channels": [...], "next_cursor": "..."}
         - Get mode: {"ok": True, "channel": {...}, "members": [...]}
     """
-    return slack_tools.get_channels(channel_id, types, limit, cursor, include_members)
+    return await slack_tools.get_channels(
+        channel_id, types, limit, cursor, include_members, force_refresh
+    )
+
+
+@server.tool()
+async def slack_resolve_channel(
+    name_or_id: Annotated[str, Field(min_length=1)],
+    force_refresh: bool = False,
+) -> dict:
+    """
+    Resolve a channel name to its channel ID.
+
+    Names are looked up in a cached index of the user's channels, so repeated
+    lookups don't walk the full channel list. Channel IDs are returned as-is.
+    The index can be up to 10 minutes old; a name that isn't found triggers
+    one rebuild, or pass force_refresh to rebuild it up front.
+
+    Args:
+        name_or_id: Channel name (e.g., '#general' or 'general') or channel ID
+        force_refresh: Bypass the cached channel index (default: False)
+
+    Returns:
+        Dictionary with the channel ID: {"ok": True, "channel_id": "C..."}
+    """
+    return await slack_tools.resolve_channel(name_or_id, force_refresh)
+
+
+@server.tool()
+async def slack_resolve_user(
+    name_or_id: Annotated[str, Field(min_length=1)],
+    force_refresh: bool = False,
+) -> dict:
+    """
+    Resolve a username or display name to its user ID.
+
+    Names are looked up in a cached index of workspace users, so repeated
+    lookups don't walk the full user list. User IDs are returned as-is.
+    The index can be up to 10 minutes old; a name that isn't found triggers
+    one rebuild, or pass force_refresh to rebuild it up front.
+
+    Args:
+        name_or_id: Username or display name (e.g., '@john' or 'john') or user ID
+        force_refresh: Bypass the cached user index (default: False)
+
+    Returns:
+        Dictionary with the user ID: {"ok": True, "user_id": "U..."}
+        - Ambiguous display name: {"ok": False, "error": "...", "candidates": ["U...", ...]}
+    """
+    return await slack_tools.resolve_user(name_or_id, force_refresh)
 
 
 @server.tool()
@@ -235,8 +367,6 @@ def slack_get_oauth_url() -> dict:
     Returns:
         Dictionary with authorization URL
     """
-    from auth.session_store import get_session_store
-
     config = get_oauth_config()
     if not config.is_configured():
         return {
@@ -244,17 +374,9 @@ def slack_get_oauth_url() -> dict:
             "error": "OAuth not configured. Please set SLACK_CLIENT_ID and SLACK_CLIENT_SECRET.",
         }
 
-    # Get session ID from FastMCP context
-    session_id = None
-    try:
-        ctx = get_context()
-        if ctx and hasattr(ctx, "session_id"):
-            session_id = ctx.session_id
-            logger.info(f"Got FastMCP session ID: {session_id}")
-            # Also set it in our context variable for other functions
-            context.fastmcp_session_id.set(session_id)
-    except Exception as e:
-        logger.error(f"Error getting FastMCP context: {e}")
+    # Get session ID from FastMCP context (also sets our context variables)
+    session_id, _ = slack_tools.get_session_context()
+    logger.info("Got FastMCP session ID: %s", session_id)
 
     if not session_id:
         return {
@@ -276,11 +398,93 @@ def slack_get_oauth_url() -> dict:
     }
 
 
-# Add health check endpoint for ECS
-@server.custom_route("/health", methods=["GET"])
-async def health_check(request: Request):
-    """Health check endpoint for load balancer."""
-    return JSONResponse({"status": "healthy"})
+# OAuth callback pages, built once at import time.
+# Values substituted into the templates must be HTML-escaped.
+_NO_CODE_HTML = b"""
+<html>
+    <body>
+        <h1>OAuth Error</h1>
+        <p>No authorization code received.</p>
+        <p>You can close this window.</p>
+    </body>
+</html>
+"""
+
+_NO_STATE_HTML = b"""
+<html>
+    <body>
+        <h1>Authentication Failed</h1>
+        <p>Error: Missing OAuth state parameter.</p>
+        <p>This may indicate a CSRF attack attempt.</p>
+        <p>You can close this window.</p>
+    </body>
+</html>
+"""
+
+_UNKNOWN_STATE_HTML = b"""
+<html>
+    <body>
+        <h1>Authentication Failed</h1>
+        <p>Error: Invalid or expired OAuth state parameter.</p>
+        <p>Please generate a new OAuth URL using the slack_get_oauth_url tool.</p>
+        <p>You can close this window.</p>
+    </body>
+</html>
+"""
+
+_INVALID_STATE_HTML = b"""
+<html>
+    <body>
+        <h1>Authentication Failed</h1>
+        <p>Error: Invalid or expired OAuth state parameter.</p>
+        <p>This may indicate a CSRF attack attempt or an expired authorization request.</p>
+        <p>Please generate a new OAuth URL and try again.</p>
+        <p>You can close this window.</p>
+    </body>
+</html>
+"""
+
+_OAUTH_ERROR_HTML_TMPL = Template("""
+<html>
+    <body>
+        <h1>OAuth Error</h1>
+        <p>Error: $error</p>
+        <p>You can close this window.</p>
+    </body>
+</html>
+""")
+
+_EXCHANGE_ERROR_HTML_TMPL = Template("""
+<html>
+    <body>
+        <h1>Authentication Failed</h1>
+        <p>Error: $error</p>
+        <p>You can close this window.</p>
+    </body>
+</html>
+""")
+
+_UNEXPECTED_ERROR_HTML_TMPL = Template("""
+<html>
+    <body>
+        <h1>Authentication Failed</h1>
+        <p>An unexpected error occurred during authentication.</p>
+        <p>Error: $error</p>
+        <p>You can close this window and try again.</p>
+    </body>
+</html>
+""")
+
+_SUCCESS_HTML_TMPL = Template("""
+<html>
+    <body>
+        <h1>✅ Authentication Successful!</h1>
+        <p>You have been authenticated as user: <strong>$user_id</strong></p>
+        <p>Your session is now authorized to access Slack.</p>
+        <p>You can close this window.</p>
+    </body>
+</html>
+""")
 
 
 # Add OAuth callback endpoint for HTTP transport
@@ -297,94 +501,35 @@ async def oauth_callback(request: Request):
 
     if error:
         return HTMLResponse(
-            content=f"""
-            <html>
-                <body>
-                    <h1>OAuth Error</h1>
-                    <p>Error: {error}</p>
-                    <p>You can close this window.</p>
-                </body>
-            </html>
-            """,
+            content=_OAUTH_ERROR_HTML_TMPL.substitute(error=html.escape(error)),
             status_code=400,
         )
 
     if not code:
-        return HTMLResponse(
-            content="""
-            <html>
-                <body>
-                    <h1>OAuth Error</h1>
-                    <p>No authorization code received.</p>
-                    <p>You can close this window.</p>
-                </body>
-            </html>
-            """,
-            status_code=400,
-        )
+        return Response(content=_NO_CODE_HTML, media_type="text/html", status_code=400)
 
     # Extract state parameter for CSRF validation
     state = request.query_params.get("state")
 
     if not state:
-        return HTMLResponse(
-            content="""
-            <html>
-                <body>
-                    <h1>Authentication Failed</h1>
-                    <p>Error: Missing OAuth state parameter.</p>
-                    <p>This may indicate a CSRF attack attempt.</p>
-                    <p>You can close this window.</p>
-                </body>
-            </html>
-            """,
-            status_code=400,
-        )
+        return Response(content=_NO_STATE_HTML, media_type="text/html", status_code=400)
 
     # Validate OAuth state parameter and get the bound session ID (CSRF protection)
-    from auth.session_store import get_session_store
-
     store = get_session_store()
 
-    # Get the session_id that was bound to this state
-    # We need to look it up before validation to know which session to validate against
-    with store._lock:
-        if state not in store._oauth_states:
-            logger.error(f"Invalid OAuth state: {state} not found")
-            return HTMLResponse(
-                content="""
-                <html>
-                    <body>
-                        <h1>Authentication Failed</h1>
-                        <p>Error: Invalid or expired OAuth state parameter.</p>
-                        <p>Please generate a new OAuth URL using the slack_get_oauth_url tool.</p>
-                        <p>You can close this window.</p>
-                    </body>
-                </html>
-                """,
-                status_code=400,
-            )
-        session_id, _ = store._oauth_states[state]
+    # Atomically consume the state and get the session_id that was bound to it
+    popped = store.pop_oauth_state(state)
+    if popped is None:
+        logger.error("Invalid OAuth state: %s not found", state)
+        return Response(content=_UNKNOWN_STATE_HTML, media_type="text/html", status_code=400)
+    session_id, timestamp = popped
 
-    logger.info(f"OAuth callback with session ID: {session_id}")
+    logger.info("OAuth callback with session ID: %s", session_id)
 
-    # Validate and consume the OAuth state
-    if not store.validate_and_consume_oauth_state(state, session_id):
-        logger.error(f"SECURITY: Invalid OAuth state for session {session_id}")
-        return HTMLResponse(
-            content="""
-            <html>
-                <body>
-                    <h1>Authentication Failed</h1>
-                    <p>Error: Invalid or expired OAuth state parameter.</p>
-                    <p>This may indicate a CSRF attack attempt or an expired authorization request.</p>
-                    <p>Please generate a new OAuth URL and try again.</p>
-                    <p>You can close this window.</p>
-                </body>
-            </html>
-            """,
-            status_code=400,
-        )
+    # Validate the OAuth state has not expired
+    if store.is_oauth_state_expired(timestamp):
+        logger.error("SECURITY: Expired OAuth state for session %s", session_id)
+        return Response(content=_INVALID_STATE_HTML, media_type="text/html", status_code=400)
 
     # Set session context for token exchange
     context.fastmcp_session_id.set(session_id)
@@ -395,102 +540,103 @@ async def oauth_callback(request: Request):
 
         if exchange_error:
             return HTMLResponse(
-                content=f"""
-                <html>
-                    <body>
-                        <h1>Authentication Failed</h1>
-                        <p>Error: {exchange_error}</p>
-                        <p>You can close this window.</p>
-                    </body>
-                </html>
-                """,
+                content=_EXCHANGE_ERROR_HTML_TMPL.substitute(error=html.escape(exchange_error)),
                 status_code=500,
             )
 
-        return HTMLResponse(
-            content=f"""
-            <html>
-                <body>
-                    <h1>✅ Authentication Successful!</h1>
-                    <p>You have been authenticated as user: <strong>{user_id}</strong></p>
-                    <p>Your session is now authorized to access Slack.</p>
-                    <p>You can close this window.</p>
-                </body>
-            </html>
-            """
-        )
+        # Warm the channel cache in the background so the first channel lookup is fast
+        context.authenticated_user_id.set(user_id)
+        task = asyncio.create_task(slack_tools.warm_channel_cache())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+        return HTMLResponse(content=_SUCCESS_HTML_TMPL.substitute(user_id=html.escape(user_id)))
     except Exception as e:
         # Catch any unexpected exceptions and return user-friendly error
-        logger.error(f"Unexpected error in OAuth callback: {e}", exc_info=True)
+        logger.error("Unexpected error in OAuth callback: %s", e, exc_info=True)
         return HTMLResponse(
-            content=f"""
-            <html>
-                <body>
-                    <h1>Authentication Failed</h1>
-                    <p>An unexpected error occurred during authentication.</p>
-                    <p>Error: {e!s}</p>
-                    <p>You can close this window and try again.</p>
-                </body>
-            </html>
-            """,
+            content=_UNEXPECTED_ERROR_HTML_TMPL.substitute(error=html.escape(str(e))),
             status_code=500,
         )
 
 
+def _install_uvloop() -> bool:
+    """
+    Use uvloop as the asyncio event loop when it is available.
+
+    uvloop is an optional dependency (the "uvloop" extra) and does not
+    support Windows, so the default asyncio loop is kept otherwise.
+
+    Returns:
+        True if uvloop was installed, False otherwise
+    """
+    if sys.platform == "win32":
+        return False
+
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not installed, using default asyncio event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("Using uvloop event loop")
+    return True
+
+
 def main():
     """Main entry point for the Slack MCP server."""
+    _install_uvloop()
+
     # Set port and base URI
     port = int(os.getenv("SLACK_MCP_PORT", "8001"))
     base_uri = os.getenv("SLACK_MCP_BASE_URI", "http://localhost")
     external_url = os.getenv("SLACK_EXTERNAL_URL")
     display_url = external_url if external_url else f"{base_uri}:{port}"
 
-    safe_print("🔧 Slack MCP Server")
-    safe_print("=" * 35)
-    safe_print("📋 Server Information:")
-
-    try:
-        version = metadata.version("slack-mcp")
-    except metadata.PackageNotFoundError:
-        version = "dev"
-
-    safe_print(f"   📦 Version: {version}")
-    safe_print("   🌐 Transport: HTTP")
-    safe_print(f"   🔗 URL: {display_url}")
-    safe_print(f"   🔐 OAuth Callback: {display_url}/oauth2callback")
-    safe_print(f"   🐍 Python: {sys.version.split()[0]}")
-    safe_print("")
-
-    # Active Configuration
-    safe_print("⚙️ Active Configuration:")
-
     config = get_oauth_config()
     client_id = config.client_id or "Not Set"
 
-    safe_print(f"   - SLACK_CLIENT_ID: {client_id}")
-    safe_print(f"   - SLACK_MCP_BASE_URI: {base_uri}")
-    safe_print(f"   - SLACK_MCP_PORT: {port}")
-    safe_print("")
-
-    safe_print("🛠️  Available Tools:")
-    safe_print("   📜 slack_get_channel_messages - Retrieve channel messages")
-    safe_print("   💬 slack_get_thread_replies - Get thread replies")
-    safe_print("   🔍 slack_search_messages - Search messages")
-    safe_print("   👤 slack_get_users - List users or get user profile")
-    safe_print("   📢 slack_get_channels - List channels or get channel info")
-    safe_print("   🔐 slack_get_oauth_url - Get OAuth authorization URL")
-    safe_print("")
+    # Build the whole startup banner up front and write it once
+    banner = textwrap.dedent(f"""\
+        🔧 Slack MCP Server
+        {"=" * 35}
+        📋 Server Information:
+           📦 Version: {__version__}
+           🌐 Transport: HTTP
+           🔗 URL: {display_url}
+           🔐 OAuth Callback: {display_url}/oauth2callback
+           🐍 Python: {sys.version.split()[0]}
+
+        ⚙️ Active Configuration:
+           - SLACK_CLIENT_ID: {client_id}
+           - SLACK_MCP_BASE_URI: {base_uri}
+           - SLACK_MCP_PORT: {port}
+
+        🛠️  Available Tools:
+           📜 slack_get_channel_messages - Retrieve channel messages
+           💬 slack_get_thread_replies - Get thread replies
+           🔍 slack_search_messages - Search messages
+           👤 slack_get_users - List users or get user profile
+           📢 slack_get_channels - List channels or get channel info
+           #️⃣  slack_resolve_channel - Resolve channel name to ID
+           🆔 slack_resolve_user - Resolve username to ID
+           🔐 slack_get_oauth_url - Get OAuth authorization URL
+        """)
 
     if not config.is_configured():
-        safe_print("⚠️  Warning: OAuth not configured!")
-        safe_print("   Please set SLACK_CLIENT_ID and SLACK_CLIENT_SECRET environment variables")
-        safe_print("")
+        banner += textwrap.dedent("""
+            ⚠️  Warning: OAuth not configured!
+               Please set SLACK_CLIENT_ID and SLACK_CLIENT_SECRET environment variables
+            """)
 
-    try:
-        safe_print("🚀 Starting HTTP server")
-        safe_print("✅ Ready for MCP connections")
-        safe_print("")
+    banner += textwrap.dedent("""
+        🚀 Starting HTTP server
+        ✅ Ready for MCP connections
+        """)
+    safe_print(banner)
 
+    try:
         server.run(transport="streamable-http", host="0.0.0.0", port=port)
 
     except KeyboardInterrupt:
@@ -498,7 +644,7 @@ def main():
         sys.exit(0)
     except Exception as e:
         safe_print(f"\n❌ Server error: {e}")
-        logger.error(f"Unexpected error running server: {e}", exc_info=True)
+        logger.error("Unexpected error running server: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -6,50 +6,108 @@ All tools use session-based authentication and automatically retrieve
 the appropriate user's credentials from the session context.
 """
 
+import asyncio
+import functools
 import logging
 import re
+import time
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from auth import context
 from auth.oauth_handler import get_slack_client_for_session, validate_session_token
+from auth.session_store import get_session_store
 from fastmcp.server.dependencies import get_context
 from slack_sdk.errors import SlackApiError
 
 logger = logging.getLogger(__name__)
 
+# Largest page size accepted by Slack list methods
+MAX_PAGE_SIZE = 1000
 
-def _parse_relative_date(date_str: str) -> Optional[str]:
+# Channel and user lists change slowly and the list methods are rate limited,
+# so list results are cached per authenticated user for a short time
+LIST_CACHE_TTL_SECONDS = 600
+LIST_CACHE_MAX_ENTRIES = 64
+
+# A name missing from a cached index triggers a rebuild, but at most once per
+# this many seconds, so a typo can't cause a full list walk on every call
+INDEX_MISS_REFRESH_SECONDS = 60
+
+# Maps (user_id, kind, *args) -> (timestamp, result)
+_list_cache: Dict[tuple, Tuple[float, object]] = {}
+
+# Full list walks currently running, so concurrent cold-cache lookups share one
+_inflight_walks: Dict[tuple, asyncio.Future] = {}
+
+# Values already in Slack ID form don't need a name lookup
+_CHANNEL_ID_RE = re.compile(r"^[CGD][A-Z0-9]{8,}$")
+_USER_ID_RE = re.compile(r"^[UW][A-Z0-9]{8,}$")
+
+# Channel types accepted by conversations.list
+_VALID_TYPES = frozenset({"public_channel", "private_channel", "im", "mpim"})
+
+# Relative dates like '7d', '2w', '1m', '1y'
+_REL_RE = re.compile(r"^(\d+)([dwmy])$")
+
+# Days per relative date unit (months and years are approximated)
+_REL_UNIT_DAYS = {"d": 1, "w": 7, "m": 30, "y": 365}
+
+
+@functools.lru_cache(maxsize=256)
+def _relative_offset_days(date_str: str) -> Optional[int]:
     """
-    Parse relative date strings like '7d', '1m', '2w' into YYYY-MM-DD format.
+    Parse a relative date string into a number of days before today.
+
+    Only the parse is cached; the offset is applied to the current date
+    on every call so cached entries stay correct across midnight.
 
     Args:
         date_str: Relative date string (e.g., '7d', '1m', '2w', '1y')
 
     Returns:
-        Date string in YYYY-MM-DD format, or None if invalid
+        Number of days, or None if invalid
     """
-    match = re.match(r"^(\d+)([dmwy])$", date_str.lower())
+    match = _REL_RE.match(date_str.lower())
     if not match:
         return None
 
     amount, unit = match.groups()
-    amount = int(amount)
-
-    today = datetime.now()
-    if unit == "d":
-        target_date = today - timedelta(days=amount)
-    elif unit == "w":
-        target_date = today - timedelta(weeks=amount)
-    elif unit == "m":
-        # Approximate month as 30 days
-        target_date = today - timedelta(days=amount * 30)
-    elif unit == "y":
-        # Approximate year as 365 days
-        target_date = today - timedelta(days=amount * 365)
-    else:
+    return int(amount) * _REL_UNIT_DAYS[unit]
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_absolute_date(date_str: str) -> Optional[str]:
+    """
+    Parse an absolute date string in YYYY-MM-DD format.
+
+    Args:
+        date_str: Date string (e.g., '2025-01-15' or '2025-1-5')
+
+    Returns:
+        Date string in YYYY-MM-DD format, or None if invalid
+    """
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y-%m-%d")
+    except ValueError:
         return None
 
+
+def _parse_relative_date(date_str: str) -> Optional[str]:
+    """
+    Parse relative date strings like '7d', '1m', '2w' into YYYY-MM-DD format.
+
+    Args:
+        date_str: Relative date string (e.g., '7d', '1m', '2w', '1y')
+
+    Returns:
+        Date string in YYYY-MM-DD format, or None if invalid
+    """
+    days = _relative_offset_days(date_str)
+    if days is None:
+        return None
+
+    target_date = datetime.now() - timedelta(days=days)
     return target_date.strftime("%Y-%m-%d")
 
 
@@ -69,13 +127,34 @@ def _parse_date(date_str: str) -> Optional[str]:
         return relative
 
     # Try absolute date YYYY-MM-DD
-    try:
-        parsed = datetime.strptime(date_str, "%Y-%m-%d")
-        return parsed.strftime("%Y-%m-%d")
-    except ValueError:
-        pass
+    return _parse_absolute_date(date_str)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_types(types: Optional[str]) -> Tuple[str, ...]:
+    """
+    Split and validate a comma-separated channel types filter.
+
+    Args:
+        types: Channel types (e.g., 'public_channel,private_channel'), or None
+
+    Returns:
+        Tuple of channel types, empty if no filter was given
 
-    return None
+    Raises:
+        ValueError: If any type is not a valid Slack channel type
+    """
+    if not types:
+        return ()
+
+    parsed = tuple(t.strip() for t in types.split(",") if t.strip())
+    invalid = [t for t in parsed if t not in _VALID_TYPES]
+    if invalid:
+        raise ValueError(
+            f"Invalid channel types: {', '.join(invalid)}. "
+            f"Valid types: {', '.join(sorted(_VALID_TYPES))}"
+        )
+    return parsed
 
 
 def _build_search_query(
@@ -121,35 +200,35 @@ def _build_search_query(
     return " ".join(query_parts)
 
 
-def _get_session_context():
+def get_session_context():
     """
-    Extract session ID and user ID from FastMCP context.
+    Extract session ID and user ID for the current tool call.
+
+    Tool calls run in the MCP session's task rather than the HTTP request's,
+    so the context variables set by SlackSessionMiddleware are not visible
+    here. The session ID is read from the FastMCP context once and stored in
+    the context variables for the rest of the call.
+
     Returns tuple of (session_id, user_id)
     """
-    session_id = None
-    user_id = None
-
     try:
-        ctx = get_context()
-        if ctx and hasattr(ctx, "session_id"):
-            session_id = ctx.session_id
-            context.fastmcp_session_id.set(session_id)
-
-            # Get user ID from session store
-            from auth.session_store import get_session_store
-
-            store = get_session_store()
-            user_id = store.get_user_by_session(session_id)
-            if user_id:
-                context.authenticated_user_id.set(user_id)
-                logger.debug(f"Found user {user_id} for session {session_id}")
-    except Exception as e:
-        logger.error(f"Error getting session context: {e}")
+        session_id = get_context().session_id
+    except RuntimeError as e:
+        logger.error("Error getting session context: %s", e)
+        return None, None
+
+    context.fastmcp_session_id.set(session_id)
+
+    # Get user ID from session store
+    user_id = get_session_store().get_user_by_session(session_id)
+    if user_id:
+        context.authenticated_user_id.set(user_id)
+        logger.debug("Found user %s for session %s", user_id, session_id)
 
     return session_id, user_id
 
 
-def _get_authenticated_client():
+async def _get_authenticated_client():
     """
     Get authenticated Slack client for current session.
 
@@ -157,12 +236,12 @@ def _get_authenticated_client():
 
     Returns:
         tuple: (client, user_id, error_dict)
-        - On success: (SlackClient, str, None)
+        - On success: (AsyncWebClient, str, None)
         - On failure: (None, None, {"ok": False, "error": str})
     """
-    session_id, user_id = _get_session_context()
+    session_id, user_id = get_session_context()
 
-    is_valid, error_msg = validate_session_token()
+    is_valid, error_msg = await validate_session_token()
     if not is_valid:
         return None, None, {"ok": False, "error": error_msg}
 
@@ -177,37 +256,389 @@ def _get_authenticated_client():
     return client, user_id, None
 
 
-def _resolve_channel_name(client, channel_name: str) -> Optional[str]:
+async def _collect_pages(
+    method,
+    key: str,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    **kwargs,
+):
+    """
+    Walk a cursor-paginated Slack list method, following next_cursor.
+
+    Slack often returns fewer items per page than requested, so pages are
+    fetched until `limit` items have been collected or there are no more pages.
+
+    Args:
+        method: Bound Slack client method (e.g., client.users_list)
+        key: Response key holding the items (e.g., 'members', 'channels')
+        limit: Maximum number of items to collect (None for all pages)
+        cursor: Pagination cursor to start from
+        **kwargs: Additional arguments passed to every page request
+
+    Returns:
+        tuple: (items, next_cursor, error_dict)
+        - On success: (list, str or None, None)
+        - On failure: (None, None, {"ok": False, "error": str})
+    """
+    items = []
+    while True:
+        page_size = MAX_PAGE_SIZE if limit is None else min(limit - len(items), MAX_PAGE_SIZE)
+        page_kwargs = {**kwargs, "limit": page_size}
+        if cursor:
+            page_kwargs["cursor"] = cursor
+
+        response = await method(**page_kwargs)
+        if not response.get("ok"):
+            return None, None, {"ok": False, "error": response.get("error", "Unknown error")}
+
+        page = response.get(key, [])
+        items.extend(page)
+        cursor = response.get("response_metadata", {}).get("next_cursor") or None
+
+        if not cursor or not page or (limit is not None and len(items) >= limit):
+            return items, cursor, None
+
+
+def _cache_get(key: tuple):
     """
-    Resolve a channel name to its ID, paginating through all results.
+    Get a cached list result.
+
+    Args:
+        key: Cache key, starting with the authenticated user ID
+
+    Returns:
+        Cached result, or None if missing or expired
+    """
+    entry = _list_cache.get(key)
+    if entry is None:
+        return None
+
+    timestamp, result = entry
+    if time.time() - timestamp > LIST_CACHE_TTL_SECONDS:
+        del _list_cache[key]
+        return None
+    return result
+
+
+def _cache_age(key: tuple) -> Optional[float]:
+    """
+    Get the age of a cached list result.
+
+    Args:
+        key: Cache key, starting with the authenticated user ID
+
+    Returns:
+        Seconds since the result was cached, or None if it isn't cached
+    """
+    entry = _list_cache.get(key)
+    if entry is None:
+        return None
+    return time.time() - entry[0]
+
+
+def _cache_set(key: tuple, result) -> None:
+    """
+    Cache a list result, evicting the oldest entry when the cache is full.
+
+    Args:
+        key: Cache key, starting with the authenticated user ID
+        result: Result to cache
+    """
+    if key not in _list_cache and len(_list_cache) >= LIST_CACHE_MAX_ENTRIES:
+        oldest = min(_list_cache, key=lambda k: _list_cache[k][0])
+        del _list_cache[oldest]
+    _list_cache[key] = (time.time(), result)
+
+
+def clear_list_cache(user_id: Optional[str] = None) -> None:
+    """
+    Clear cached list results.
+
+    Args:
+        user_id: Only clear entries for this user (default: clear everything)
+    """
+    if user_id is None:
+        _list_cache.clear()
+        return
+    for key in [key for key in _list_cache if key[0] == user_id]:
+        del _list_cache[key]
+
+
+async def _shared_walk(cache_key: tuple, build, force_refresh: bool = False):
+    """
+    Return a cached list result, or build it with at most one walk per key.
+
+    Callers that miss the cache while a walk for the same key is already
+    running wait for that walk instead of starting their own.
+
+    Args:
+        cache_key: Cache key for the result
+        build: Coroutine function that walks Slack and caches its result
+        force_refresh: Bypass the cache (an in-flight walk is still shared)
+
+    Returns:
+        The cached or freshly built result
+    """
+    if not force_refresh:
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+    walk = _inflight_walks.get(cache_key)
+    if walk is None:
+        walk = asyncio.ensure_future(build())
+        _inflight_walks[cache_key] = walk
+
+        def _forget(done: asyncio.Future) -> None:
+            if _inflight_walks.get(cache_key) is done:
+                del _inflight_walks[cache_key]
+
+        walk.add_done_callback(_forget)
+
+    # Shield the shared walk so one cancelled caller doesn't cancel it for the others
+    return await asyncio.shield(walk)
+
+
+async def _get_channel_index(client, force_refresh: bool = False) -> Dict[str, str]:
+    """
+    Get a channel name -> ID index of all channels visible to the authenticated user.
+
+    Public and private channels are walked concurrently, since each type
+    has its own independent cursor chain. The index is cached per user and
+    rebuilt whenever the cache is refreshed.
+
+    Args:
+        client: Authenticated Slack client
+        force_refresh: Bypass the cache and fetch from Slack
+
+    Returns:
+        Dictionary mapping channel name to channel ID
+    """
+    cache_key = (context.authenticated_user_id.get(), "channel_index")
+
+    async def build() -> Dict[str, str]:
+        results = await asyncio.gather(
+            *(
+                _collect_pages(client.conversations_list, "channels", types=channel_type)
+                for channel_type in ("public_channel", "private_channel")
+            )
+        )
+        index = {}
+        complete = True
+        for channels, _, error in results:
+            if error:
+                complete = False
+            for channel in channels or []:
+                if channel.get("name"):
+                    index.setdefault(channel["name"], channel.get("id"))
+
+        # Only cache complete walks, so a failed page doesn't hide channels for the TTL
+        if complete:
+            _cache_set(cache_key, index)
+        return index
+
+    return await _shared_walk(cache_key, build, force_refresh)
+
+
+async def _get_user_index(client, force_refresh: bool = False) -> Dict[str, Tuple[str, ...]]:
+    """
+    Get a username -> user IDs index of all users in the workspace.
+
+    Usernames are unique and always win. Display names are only indexed
+    where they don't collide with a username, and a display name shared
+    by several users maps to all of their IDs. The index is cached per
+    user and rebuilt whenever the cache is refreshed.
+
+    Args:
+        client: Authenticated Slack client
+        force_refresh: Bypass the cache and fetch from Slack
+
+    Returns:
+        Dictionary mapping username or display name to a tuple of user IDs
+    """
+    cache_key = (context.authenticated_user_id.get(), "user_index")
+
+    async def build() -> Dict[str, Tuple[str, ...]]:
+        users, _, error = await _collect_pages(client.users_list, "members")
+        users = users or []
+        index = {user["name"]: (user.get("id"),) for user in users if user.get("name")}
+
+        display_names: Dict[str, list] = {}
+        for user in users:
+            display_name = user.get("profile", {}).get("display_name")
+            if display_name and display_name not in index:
+                display_names.setdefault(display_name, []).append(user.get("id"))
+        for display_name, user_ids in display_names.items():
+            index[display_name] = tuple(user_ids)
+
+        if not error:
+            _cache_set(cache_key, index)
+        return index
+
+    return await _shared_walk(cache_key, build, force_refresh)
+
+
+async def _lookup_name(get_index, kind: str, client, name: str, force_refresh: bool = False):
+    """
+    Look a name up in a cached index, rebuilding the index once on a miss.
+
+    Names created after the index was built (e.g., a channel the user just
+    joined) would otherwise stay missing for the whole cache TTL. The rebuild
+    is skipped if the index is younger than INDEX_MISS_REFRESH_SECONDS.
+
+    Args:
+        get_index: Index getter (_get_channel_index or _get_user_index)
+        kind: Cache key kind used by the index getter
+        client: Authenticated Slack client
+        name: Name to look up
+        force_refresh: Rebuild the index before looking the name up
+
+    Returns:
+        Index value for the name, or None if not found
+    """
+    found = (await get_index(client, force_refresh)).get(name)
+    if found is None and not force_refresh:
+        age = _cache_age((context.authenticated_user_id.get(), kind))
+        if age is not None and age >= INDEX_MISS_REFRESH_SECONDS:
+            logger.debug("%s not in cached %s, rebuilding", name, kind)
+            found = (await get_index(client, force_refresh=True)).get(name)
+    return found
+
+
+async def _resolve_channel_name(
+    client, channel_name: str, force_refresh: bool = False
+) -> Optional[str]:
+    """
+    Resolve a channel name to its ID using the cached channel index.
 
     Args:
         client: Authenticated Slack client
         channel_name: Channel name (without #)
+        force_refresh: Rebuild the channel index before the lookup
 
     Returns:
         Channel ID if found, None otherwise
     """
-    cursor = None
-    while True:
-        kwargs = {"types": "public_channel,private_channel"}
-        if cursor:
-            kwargs["cursor"] = cursor
+    return await _lookup_name(
+        _get_channel_index, "channel_index", client, channel_name, force_refresh
+    )
+
+
+async def warm_channel_cache() -> None:
+    """
+    Populate the channel cache for the current session's user.
+
+    Called after OAuth so the first channel name lookup doesn't pay for
+    a full conversations.list walk.
+    """
+    client = get_slack_client_for_session()
+    if not client:
+        return
+
+    try:
+        await _get_channel_index(client, force_refresh=True)
+    except Exception as e:
+        logger.warning("Failed to warm channel cache: %s", e)
+
 
-        channels_response = client.conversations_list(**kwargs)
-        for channel in channels_response.get("channels", []):
-            if channel.get("name") == channel_name:
-                return channel.get("id")
+async def resolve_channel(name_or_id: str, force_refresh: bool = False) -> dict:
+    """
+    Resolve a channel name to its channel ID.
+
+    Uses the authenticated user's credentials from the current session context.
 
-        # Check if there are more pages
-        cursor = channels_response.get("response_metadata", {}).get("next_cursor")
-        if not cursor:
-            break
+    Args:
+        name_or_id: Channel name (e.g., '#general' or 'general') or channel ID
+        force_refresh: Rebuild the cached channel index before the lookup
 
-    return None
+    Returns:
+        Dictionary with the channel ID
+    """
+    if _CHANNEL_ID_RE.match(name_or_id):
+        return {"ok": True, "channel_id": name_or_id}
 
+    client, user_id, error = await _get_authenticated_client()
+    if error:
+        return error
 
-def get_channel_messages(
+    channel_name = name_or_id.lstrip("#")
+    logger.debug("resolve_channel called by user %s for channel %s", user_id, channel_name)
+
+    try:
+        channel_id = await _resolve_channel_name(client, channel_name, force_refresh)
+        if not channel_id:
+            return {"ok": False, "error": f"Channel '{channel_name}' not found"}
+
+        return {"ok": True, "channel_id": channel_id, "name": channel_name}
+
+    except SlackApiError as e:
+        logger.error(
+            "Slack API error in resolve_channel: %s", e.response.get("error", "Unknown error")
+        )
+        return {
+            "ok": False,
+            "error": f"Slack API error: {e.response.get('error', 'Unknown error')}",
+        }
+    except Exception as e:
+        logger.error("Error in resolve_channel: %s", e)
+        return {"ok": False, "error": f"Error: {e!s}"}
+
+
+async def resolve_user(name_or_id: str, force_refresh: bool = False) -> dict:
+    """
+    Resolve a username or display name to its user ID.
+
+    Uses the authenticated user's credentials from the current session context.
+
+    Args:
+        name_or_id: Username (e.g., '@john' or 'john') or user ID
+        force_refresh: Rebuild the cached user index before the lookup
+
+    Returns:
+        Dictionary with the user ID, or an error with candidate IDs if a
+        display name matches several users
+    """
+    if _USER_ID_RE.match(name_or_id):
+        return {"ok": True, "user_id": name_or_id}
+
+    client, user_id, error = await _get_authenticated_client()
+    if error:
+        return error
+
+    username = name_or_id.lstrip("@")
+    logger.debug("resolve_user called by user %s for user %s", user_id, username)
+
+    try:
+        user_ids = await _lookup_name(
+            _get_user_index, "user_index", client, username, force_refresh
+        )
+        if not user_ids:
+            return {"ok": False, "error": f"User '{username}' not found"}
+
+        if len(user_ids) > 1:
+            return {
+                "ok": False,
+                "error": f"User '{username}' is ambiguous",
+                "candidates": list(user_ids),
+            }
+
+        return {"ok": True, "user_id": user_ids[0], "name": username}
+
+    except SlackApiError as e:
+        logger.error(
+            "Slack API error in resolve_user: %s", e.response.get("error", "Unknown error")
+        )
+        return {
+            "ok": False,
+            "error": f"Slack API error: {e.response.get('error', 'Unknown error')}",
+        }
+    except Exception as e:
+        logger.error("Error in resolve_user: %s", e)
+        return {"ok": False, "error": f"Error: {e!s}"}
+
+
+async def get_channel_messages(
     channel_id: str,
     limit: int = 100,
     cursor: Optional[str] = None,
@@ -225,17 +656,17 @@ def get_channel_messages(
     Returns:
         Dictionary with messages and pagination info
     """
-    client, user_id, error = _get_authenticated_client()
+    client, user_id, error = await _get_authenticated_client()
     if error:
         return error
 
-    logger.debug(f"get_channel_messages called by user {user_id} for channel {channel_id}")
+    logger.debug("get_channel_messages called by user %s for channel %s", user_id, channel_id)
 
     try:
         # Handle channel name format (e.g., '#general' -> lookup ID)
         if channel_id.startswith("#"):
             channel_name = channel_id[1:]
-            channel_id = _resolve_channel_name(client, channel_name)
+            channel_id = await _resolve_channel_name(client, channel_name)
             if not channel_id:
                 return {"ok": False, "error": f"Channel '{channel_name}' not found"}
 
@@ -244,7 +675,7 @@ def get_channel_messages(
         if cursor:
             kwargs["cursor"] = cursor
 
-        response = client.conversations_history(**kwargs)
+        response = await client.conversations_history(**kwargs)
 
         if not response.get("ok"):
             return {"ok": False, "error": response.get("error", "Unknown error")}
@@ -258,18 +689,18 @@ def get_channel_messages(
 
     except SlackApiError as e:
         logger.error(
-            f"Slack API error in get_channel_messages: {e.response.get('error', 'Unknown error')}"
+            "Slack API error in get_channel_messages: %s", e.response.get("error", "Unknown error")
         )
         return {
             "ok": False,
             "error": f"Slack API error: {e.response.get('error', 'Unknown error')}",
         }
     except Exception as e:
-        logger.error(f"Error in get_channel_messages: {e}")
+        logger.error("Error in get_channel_messages: %s", e)
         return {"ok": False, "error": f"Error: {e!s}"}
 
 
-def get_thread_replies(
+async def get_thread_replies(
     channel_id: str,
     thread_ts: str,
     limit: int = 100,
@@ -289,19 +720,22 @@ def get_thread_replies(
     Returns:
         Dictionary with messages (replies) and pagination info
     """
-    client, user_id, error = _get_authenticated_client()
+    client, user_id, error = await _get_authenticated_client()
     if error:
         return error
 
     logger.debug(
-        f"get_thread_replies called by user {user_id} for channel {channel_id}, thread {thread_ts}"
+        "get_thread_replies called by user %s for channel %s, thread %s",
+        user_id,
+        channel_id,
+        thread_ts,
     )
 
     try:
         # Handle channel name format
         if channel_id.startswith("#"):
             channel_name = channel_id[1:]
-            channel_id = _resolve_channel_name(client, channel_name)
+            channel_id = await _resolve_channel_name(client, channel_name)
             if not channel_id:
                 return {"ok": False, "error": f"Channel '{channel_name}' not found"}
 
@@ -310,7 +744,7 @@ def get_thread_replies(
         if cursor:
             kwargs["cursor"] = cursor
 
-        response = client.conversations_replies(**kwargs)
+        response = await client.conversations_replies(**kwargs)
 
         if not response.get("ok"):
             return {"ok": False, "error": response.get("error", "Unknown error")}
@@ -324,18 +758,18 @@ def get_thread_replies(
 
     except SlackApiError as e:
         logger.error(
-            f"Slack API error in get_thread_replies: {e.response.get('error', 'Unknown error')}"
+            "Slack API error in get_thread_replies: %s", e.response.get("error", "Unknown error")
         )
         return {
             "ok": False,
             "error": f"Slack API error: {e.response.get('error', 'Unknown error')}",
         }
     except Exception as e:
-        logger.error(f"Error in get_thread_replies: {e}")
+        logger.error("Error in get_thread_replies: %s", e)
         return {"ok": False, "error": f"Error: {e!s}"}
 
 
-def search_messages(
+async def search_messages(
     query: str,
     count: int = 20,
     page: int = 1,
@@ -375,7 +809,7 @@ def search_messages(
         # Date range search
         search_messages("report", after_date="2025-01-01", before_date="2025-01-31")
     """
-    client, user_id, error = _get_authenticated_client()
+    client, user_id, error = await _get_authenticated_client()
     if error:
         return error
 
@@ -404,12 +838,12 @@ def search_messages(
         )
 
         logger.debug(
-            f"search_messages called by user {user_id} with enhanced query: {enhanced_query}"
+            "search_messages called by user %s with enhanced query: %s", user_id, enhanced_query
         )
 
         # Slack API doesn't support sort_by/sort_order parameters, so we apply
         # client-side sorting to the current page of results only
-        response = client.search_messages(
+        response = await client.search_messages(
             query=enhanced_query,
             count=min(count, 100),
             page=page,
@@ -445,21 +879,22 @@ def search_messages(
 
     except SlackApiError as e:
         logger.error(
-            f"Slack API error in search_messages: {e.response.get('error', 'Unknown error')}"
+            "Slack API error in search_messages: %s", e.response.get("error", "Unknown error")
         )
         return {
             "ok": False,
             "error": f"Slack API error: {e.response.get('error', 'Unknown error')}",
         }
     except Exception as e:
-        logger.error(f"Error in search_messages: {e}")
+        logger.error("Error in search_messages: %s", e)
         return {"ok": False, "error": f"Error: {e!s}"}
 
 
-def get_users(
+async def get_users(
     user_id: Optional[str] = None,
     limit: int = 100,
     cursor: Optional[str] = None,
+    force_refresh: bool = False,
 ) -> dict:
     """
     Get users from Slack workspace.
@@ -474,19 +909,20 @@ def get_users(
         user_id: Optional user ID. If provided, gets specific user profile
         limit: Maximum number of users to retrieve when listing (default: 100, max: 1000)
         cursor: Pagination cursor from previous response (for listing mode)
+        force_refresh: Bypass the cached user list (for listing mode)
 
     Returns:
         Dictionary with user(s) and pagination info
     """
-    client, authenticated_user_id, error = _get_authenticated_client()
+    client, authenticated_user_id, error = await _get_authenticated_client()
     if error:
         return error
 
     try:
         if user_id:
             # Get specific user profile
-            logger.debug(f"get_users called by user {authenticated_user_id} for user {user_id}")
-            response = client.users_info(user=user_id)
+            logger.debug("get_users called by user %s for user %s", authenticated_user_id, user_id)
+            response = await client.users_info(user=user_id)
 
             if not response.get("ok"):
                 return {"ok": False, "error": response.get("error", "Unknown error")}
@@ -497,39 +933,46 @@ def get_users(
             }
         else:
             # List all users
-            logger.debug(f"get_users called by user {authenticated_user_id} to list users")
-            kwargs = {"limit": min(limit, 1000)}
-            if cursor:
-                kwargs["cursor"] = cursor
-
-            response = client.users_list(**kwargs)
-
-            if not response.get("ok"):
-                return {"ok": False, "error": response.get("error", "Unknown error")}
+            logger.debug("get_users called by user %s to list users", authenticated_user_id)
+            limit = min(limit, 1000)
+            cache_key = (authenticated_user_id, "users", limit, cursor)
+            if not force_refresh:
+                cached = _cache_get(cache_key)
+                if cached is not None:
+                    return cached
+
+            users, next_cursor, error = await _collect_pages(
+                client.users_list, "members", limit, cursor
+            )
+            if error:
+                return error
 
-            return {
+            result = {
                 "ok": True,
-                "users": response.get("members", []),
-                "next_cursor": response.get("response_metadata", {}).get("next_cursor"),
+                "users": users,
+                "next_cursor": next_cursor,
             }
+            _cache_set(cache_key, result)
+            return result
 
     except SlackApiError as e:
-        logger.error(f"Slack API error in get_users: {e.response.get('error', 'Unknown error')}")
+        logger.error("Slack API error in get_users: %s", e.response.get("error", "Unknown error"))
         return {
             "ok": False,
             "error": f"Slack API error: {e.response.get('error', 'Unknown error')}",
         }
     except Exception as e:
-        logger.error(f"Error in get_users: {e}")
+        logger.error("Error in get_users: %s", e)
         return {"ok": False, "error": f"Error: {e!s}"}
 
 
-def get_channels(
+async def get_channels(
     channel_id: Optional[str] = None,
     types: Optional[str] = None,
     limit: int = 100,
     cursor: Optional[str] = None,
     include_members: bool = False,
+    force_refresh: bool = False,
 ) -> dict:
     """
     Get channels from Slack workspace.
@@ -547,11 +990,17 @@ def get_channels(
         limit: Maximum number of channels to retrieve when listing (default: 100, max: 1000)
         cursor: Pagination cursor from previous response (for listing mode)
         include_members: Include member list when getting specific channel (default: False)
+        force_refresh: Bypass the cached channel list (for listing mode)
 
     Returns:
         Dictionary with channel(s) and pagination info
     """
-    client, authenticated_user_id, error = _get_authenticated_client()
+    try:
+        type_list = _parse_types(types)
+    except ValueError as e:
+        return {"ok": False, "error": str(e)}
+
+    client, authenticated_user_id, error = await _get_authenticated_client()
     if error:
         return error
 
@@ -559,9 +1008,9 @@ def get_channels(
         if channel_id:
             # Get specific channel info
             logger.debug(
-                f"get_channels called by user {authenticated_user_id} for channel {channel_id}"
+                "get_channels called by user %s for channel %s", authenticated_user_id, channel_id
             )
-            response = client.conversations_info(channel=channel_id)
+            response = await client.conversations_info(channel=channel_id)
 
             if not response.get("ok"):
                 return {"ok": False, "error": response.get("error", "Unknown error")}
@@ -575,26 +1024,17 @@ def get_channels(
             if include_members:
                 try:
                     # Fetch all members with pagination
-                    all_members = []
-                    members_cursor = None
-                    while True:
-                        kwargs = {"channel": channel_id}
-                        if members_cursor:
-                            kwargs["cursor"] = members_cursor
-                        members_response = client.conversations_members(**kwargs)
-                        if members_response.get("ok"):
-                            all_members.extend(members_response.get("members", []))
-                            members_cursor = members_response.get("response_metadata", {}).get(
-                                "next_cursor"
-                            )
-                            if not members_cursor:
-                                break
-                        else:
-                            break
-                    result["members"] = all_members
+                    all_members, _, members_error = await _collect_pages(
+                        client.conversations_members, "members", channel=channel_id
+                    )
+                    result["members"] = all_members or []
+                    if members_error:
+                        result["members_error"] = members_error["error"]
                 except SlackApiError as e:
                     logger.warning(
-                        f"Failed to get members for channel {channel_id}: {e.response.get('error')}"
+                        "Failed to get members for channel %s: %s",
+                        channel_id,
+                        e.response.get("error"),
                     )
                     # Don't fail the whole request if members fetch fails
                     result["members_error"] = e.response.get("error", "Unknown error")
@@ -602,30 +1042,40 @@ def get_channels(
             return result
         else:
             # List all channels
-            logger.debug(f"get_channels called by user {authenticated_user_id} to list channels")
-            kwargs = {"limit": min(limit, 1000)}
-            if cursor:
-                kwargs["cursor"] = cursor
-            if types:
-                kwargs["types"] = types
-
-            response = client.conversations_list(**kwargs)
-
-            if not response.get("ok"):
-                return {"ok": False, "error": response.get("error", "Unknown error")}
+            logger.debug("get_channels called by user %s to list channels", authenticated_user_id)
+            limit = min(limit, 1000)
+            cache_key = (authenticated_user_id, "channels", type_list, limit, cursor)
+            if not force_refresh:
+                cached = _cache_get(cache_key)
+                if cached is not None:
+                    return cached
+
+            kwargs = {}
+            if type_list:
+                kwargs["types"] = ",".join(type_list)
+
+            channels, next_cursor, error = await _collect_pages(
+                client.conversations_list, "channels", limit, cursor, **kwargs
+            )
+            if error:
+                return error
 
-            return {
+            result = {
                 "ok": True,
-                "channels": response.get("channels", []),
-                "next_cursor": response.get("response_metadata", {}).get("next_cursor"),
+                "channels": channels,
+                "next_cursor": next_cursor,
             }
+            _cache_set(cache_key, result)
+            return result
 
     except SlackApiError as e:
-        logger.error(f"Slack API error in get_channels: {e.response.get('error', 'Unknown error')}")
+        logger.error(
+            "Slack API error in get_channels: %s", e.response.get("error", "Unknown error")
+        )
         return {
             "ok": False,
             "error": f"Slack API error: {e.response.get('error', 'Unknown error')}",
         }
     except Exception as e:
-        logger.error(f"Error in get_channels: {e}")
+        logger.error("Error in get_channels: %s", e)
         return {"ok": False, "error": f"Error: {e!s}"}
@@ -0,0 +1,43 @@
+"""
+Tests for the /health endpoint used by the ECS load balancer.
+"""
+
+import main
+import pytest
+from starlette.testclient import TestClient
+
+
+@pytest.fixture
+def client():
+    """Test client for the full HTTP app, including middleware."""
+    return TestClient(main.server.http_app())
+
+
+class TestHealthCheck:
+    """Test cases for HealthCheckMiddleware."""
+
+    def test_get_health(self, client):
+        """Test that GET returns the healthy JSON body with correct headers."""
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.content == b'{"status":"healthy"}'
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["content-length"] == str(len(response.content))
+
+    def test_head_health(self, client):
+        """Test that HEAD returns 200 with an empty body."""
+        response = client.head("/health")
+
+        assert response.status_code == 200
+        assert response.content == b""
+
+    def test_other_methods_reach_router(self, client):
+        """Test that non-probe methods fall through to normal routing."""
+        response = client.post("/health")
+
+        assert response.status_code == 404
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,48 @@
+"""
+Tests for the shared HTTP session used for outbound Slack calls.
+"""
+
+import asyncio
+
+import pytest
+from auth import http_client
+from auth.http_client import close_http_session, get_http_session, http_session_lifespan
+
+
+class TestSharedHttpSession:
+    """Test cases for the lazily created shared aiohttp session."""
+
+    def test_session_is_reused_and_recreated_after_close(self):
+        """Test that the session is shared until closed, then created again."""
+
+        async def scenario():
+            first = get_http_session()
+            assert get_http_session() is first
+
+            await close_http_session()
+            assert first.closed
+            assert http_client._http_session is None
+
+            second = get_http_session()
+            assert second is not first
+            assert not second.closed
+            await close_http_session()
+
+        asyncio.run(scenario())
+
+    def test_lifespan_closes_session(self):
+        """Test that leaving the server lifespan closes the shared session."""
+
+        async def scenario():
+            async with http_session_lifespan(server=None):
+                session = get_http_session()
+                assert not session.closed
+
+            assert session.closed
+            assert http_client._http_session is None
+
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,198 @@
+"""
+Tests for the per-user list result cache.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import slack_tools
+from slack_tools import (
+    _cache_get,
+    _cache_set,
+    _get_channel_index,
+    _resolve_channel_name,
+    clear_list_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and finish every test with an empty cache."""
+    clear_list_cache()
+    yield
+    clear_list_cache()
+
+
+class TestListCache:
+    """Test cases for list result caching."""
+
+    def test_get_returns_cached_result(self):
+        """Test that a cached result is returned before it expires."""
+        _cache_set(("U1", "users", 100, None), {"ok": True, "users": []})
+        assert _cache_get(("U1", "users", 100, None)) == {"ok": True, "users": []}
+
+    def test_entries_are_keyed_by_user(self):
+        """Test that one user's cached lists are not visible to another user."""
+        _cache_set(("U1", "channels", None, 100, None), {"ok": True, "channels": ["C1"]})
+        assert _cache_get(("U2", "channels", None, 100, None)) is None
+
+    @patch("slack_tools.time")
+    def test_expired_entries_are_dropped(self, mock_time):
+        """Test that entries older than the TTL are treated as missing."""
+        mock_time.time.return_value = 1000.0
+        _cache_set(("U1", "channel_index"), [])
+
+        mock_time.time.return_value = 1000.0 + slack_tools.LIST_CACHE_TTL_SECONDS + 1
+        assert _cache_get(("U1", "channel_index")) is None
+        assert ("U1", "channel_index") not in slack_tools._list_cache
+
+    @patch("slack_tools.time")
+    def test_oldest_entry_is_evicted_when_full(self, mock_time):
+        """Test that the cache never grows past its maximum size."""
+        for i in range(slack_tools.LIST_CACHE_MAX_ENTRIES + 1):
+            mock_time.time.return_value = float(i)
+            _cache_set(("U1", "users", i, None), {"ok": True})
+
+        assert len(slack_tools._list_cache) == slack_tools.LIST_CACHE_MAX_ENTRIES
+        assert _cache_get(("U1", "users", 0, None)) is None
+
+    def test_clear_for_single_user(self):
+        """Test clearing the cache for one user only."""
+        _cache_set(("U1", "channel_index"), [])
+        _cache_set(("U2", "channel_index"), [])
+
+        clear_list_cache("U1")
+
+        assert _cache_get(("U1", "channel_index")) is None
+        assert _cache_get(("U2", "channel_index")) == []
+
+
+class _FakeClient:
+    """Fake Slack client whose list methods return one page tagged with the caller."""
+
+    def __init__(self, owner: str):
+        self.users_list = AsyncMock(return_value={"ok": True, "members": [{"id": owner}]})
+        self.conversations_list = AsyncMock(side_effect=self._conversations)
+
+    async def _conversations(self, **kwargs):
+        # Yield to the event loop like a real request, so concurrent walks overlap
+        await asyncio.sleep(0)
+        return {"ok": True, "channels": [{"id": "C01ABCDEFGH", "name": "general"}]}
+
+
+def _authenticate_as(*users):
+    """Patch _get_authenticated_client to return a fresh client per listed user in turn."""
+    clients = {user: _FakeClient(user) for user in users}
+    side_effect = [(clients[user], user, None) for user in users]
+    return patch.object(
+        slack_tools, "_get_authenticated_client", AsyncMock(side_effect=side_effect)
+    ), clients
+
+
+class TestToolCaching:
+    """Test cases for caching through the get_users and get_channels tools."""
+
+    def test_get_users_returns_cached_result(self):
+        """Test that a second list call is answered from the cache."""
+        auth, clients = _authenticate_as("U1", "U1")
+        with auth:
+            first = asyncio.run(slack_tools.get_users())
+            second = asyncio.run(slack_tools.get_users())
+
+        assert second == first
+        # Both calls share one client per user in this fake
+        assert clients["U1"].users_list.await_count == 1
+
+    def test_force_refresh_goes_back_to_slack(self):
+        """Test that force_refresh bypasses a warm cache."""
+        auth, clients = _authenticate_as("U1", "U1")
+        with auth:
+            asyncio.run(slack_tools.get_channels())
+            asyncio.run(slack_tools.get_channels(force_refresh=True))
+
+        assert clients["U1"].conversations_list.await_count == 2
+
+    def test_users_do_not_share_entries(self):
+        """Test that one user's cached list is never returned to another user."""
+        auth, clients = _authenticate_as("U1", "U2")
+        with auth:
+            first = asyncio.run(slack_tools.get_users())
+            second = asyncio.run(slack_tools.get_users())
+
+        assert first["users"] == [{"id": "U1"}]
+        assert second["users"] == [{"id": "U2"}]
+        assert clients["U2"].users_list.await_count == 1
+
+    def test_concurrent_index_lookups_share_one_walk(self):
+        """Test that concurrent cold-cache index lookups walk the channel list once."""
+        client = _FakeClient("U1")
+
+        async def lookup_twice():
+            return await asyncio.gather(_get_channel_index(client), _get_channel_index(client))
+
+        first, second = asyncio.run(lookup_twice())
+
+        assert first == second == {"general": "C01ABCDEFGH"}
+        # One walk covers public and private channels
+        assert client.conversations_list.await_count == 2
+        assert slack_tools._inflight_walks == {}
+
+
+class _GrowingChannelsClient:
+    """Fake Slack client where a channel appears after the first walk."""
+
+    def __init__(self):
+        self.walks = 0
+        self.conversations_list = AsyncMock(side_effect=self._conversations)
+
+    async def _conversations(self, types, **kwargs):
+        if types == "public_channel":
+            self.walks += 1
+        channels = [{"id": "C01ABCDEFGH", "name": "general"}]
+        if types == "public_channel" and self.walks > 1:
+            channels.append({"id": "C02ABCDEFGH", "name": "new-channel"})
+        return {"ok": True, "channels": channels}
+
+
+class TestIndexRefreshOnMiss:
+    """Test cases for rebuilding the channel index when a name is missing."""
+
+    @patch("slack_tools.time")
+    def test_missing_name_rebuilds_stale_index(self, mock_time):
+        """Test that a channel created after the index was built is found."""
+        client = _GrowingChannelsClient()
+        mock_time.time.return_value = 1000.0
+        asyncio.run(_get_channel_index(client))
+
+        mock_time.time.return_value = 1000.0 + slack_tools.INDEX_MISS_REFRESH_SECONDS
+        channel_id = asyncio.run(_resolve_channel_name(client, "new-channel"))
+
+        assert channel_id == "C02ABCDEFGH"
+        assert client.walks == 2
+
+    @patch("slack_tools.time")
+    def test_missing_name_does_not_rebuild_fresh_index(self, mock_time):
+        """Test that repeated misses on a fresh index don't walk the list again."""
+        client = _GrowingChannelsClient()
+        mock_time.time.return_value = 1000.0
+        asyncio.run(_get_channel_index(client))
+
+        mock_time.time.return_value = 1001.0
+        assert asyncio.run(_resolve_channel_name(client, "typo")) is None
+        assert asyncio.run(_resolve_channel_name(client, "typo")) is None
+        assert client.walks == 1
+
+    def test_force_refresh_rebuilds_index(self):
+        """Test that force_refresh always rebuilds before the lookup."""
+        client = _GrowingChannelsClient()
+        asyncio.run(_get_channel_index(client))
+
+        channel_id = asyncio.run(_resolve_channel_name(client, "new-channel", force_refresh=True))
+
+        assert channel_id == "C02ABCDEFGH"
+        assert client.walks == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
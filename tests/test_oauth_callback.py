@@ -0,0 +1,73 @@
+"""
+Tests for the OAuth callback endpoint.
+
+These tests verify that values reflected into the callback pages are
+HTML-escaped, so query parameters can't inject markup.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import main
+import pytest
+from auth.session_store import SlackSessionStore
+from starlette.testclient import TestClient
+
+XSS_PAYLOAD = "<script>x</script>"
+ESCAPED_PAYLOAD = "&lt;script&gt;x&lt;/script&gt;"
+
+
+@pytest.fixture
+def client():
+    """Test client for the full HTTP app, including middleware."""
+    return TestClient(main.server.http_app())
+
+
+@pytest.fixture
+def store():
+    """Fresh session store used by the callback instead of the global one."""
+    store = SlackSessionStore()
+    with patch.object(main, "get_session_store", return_value=store):
+        yield store
+
+
+class TestOAuthCallbackEscaping:
+    """Test cases for HTML escaping in OAuth callback pages."""
+
+    def test_error_parameter_is_escaped(self, client):
+        """Test that the error query parameter is escaped in the error page."""
+        response = client.get("/oauth2callback", params={"error": XSS_PAYLOAD})
+
+        assert response.status_code == 400
+        assert ESCAPED_PAYLOAD in response.text
+        assert XSS_PAYLOAD not in response.text
+
+    def test_exchange_error_is_escaped(self, client, store):
+        """Test that token exchange errors are escaped in the error page."""
+        state = store.generate_oauth_state("session_1")
+        exchange = AsyncMock(return_value=(None, None, XSS_PAYLOAD))
+
+        with patch.object(main, "exchange_code_for_token", exchange):
+            response = client.get("/oauth2callback", params={"code": "abc", "state": state})
+
+        assert response.status_code == 500
+        assert ESCAPED_PAYLOAD in response.text
+        assert XSS_PAYLOAD not in response.text
+
+    def test_user_id_is_escaped_on_success(self, client, store):
+        """Test that the user ID is escaped in the success page."""
+        state = store.generate_oauth_state("session_1")
+        exchange = AsyncMock(return_value=("xoxp-token", XSS_PAYLOAD, None))
+
+        with (
+            patch.object(main, "exchange_code_for_token", exchange),
+            patch.object(main.slack_tools, "warm_channel_cache", AsyncMock()),
+        ):
+            response = client.get("/oauth2callback", params={"code": "abc", "state": state})
+
+        assert response.status_code == 200
+        assert ESCAPED_PAYLOAD in response.text
+        assert XSS_PAYLOAD not in response.text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -5,7 +5,7 @@ Tests for OAuth configuration.
 import os
 
 import pytest
-from auth.oauth_config import SlackOAuthConfig
+from auth.oauth_config import SlackOAuthConfig, get_oauth_config, reload_oauth_config
 
 
 def test_oauth_config_initialization():
@@ -47,5 +47,42 @@ def test_authorization_url():
     assert "user_scope=" in auth_url
 
 
+def test_authorization_url_with_state():
+    """Test that only the state changes between authorization URLs."""
+    config = SlackOAuthConfig()
+    config.client_id = "test_client_id"
+
+    url_a = config.get_authorization_url(state="state_a")
+    url_b = config.get_authorization_url(state="state_b")
+    assert url_a == config.get_authorization_url() + "&state=state_a"
+    assert url_b == config.get_authorization_url() + "&state=state_b"
+
+
+@pytest.fixture
+def restore_oauth_config(monkeypatch):
+    """Rebuild the cached OAuth config from the real environment after the test."""
+    yield
+    # Undo env changes first, so the reloaded config doesn't keep fake values
+    monkeypatch.undo()
+    reload_oauth_config()
+
+
+def test_reload_oauth_config(monkeypatch, restore_oauth_config):
+    """Test that reloading picks up changed environment variables."""
+    monkeypatch.setenv("SLACK_CLIENT_ID", "first_client_id")
+    first = reload_oauth_config()
+    assert get_oauth_config() is first
+
+    monkeypatch.setenv("SLACK_CLIENT_ID", "second_client_id")
+    assert get_oauth_config().client_id == "first_client_id"
+    assert reload_oauth_config().client_id == "second_client_id"
+    assert get_oauth_config().client_id == "second_client_id"
+
+
+def test_reload_does_not_leak(restore_oauth_config):
+    """Test that the cached config matches the real environment."""
+    assert get_oauth_config().client_id == os.getenv("SLACK_CLIENT_ID")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,77 @@
+"""
+Tests for cursor pagination of Slack list methods.
+"""
+
+import asyncio
+
+import pytest
+from slack_tools import _collect_pages
+
+
+def _fake_list_method(total: int, page_cap: int = 200):
+    """Build a fake Slack list method that returns at most page_cap items per page."""
+    calls = []
+
+    async def method(limit, cursor=None, **kwargs):
+        calls.append({"limit": limit, "cursor": cursor, **kwargs})
+        start = int(cursor or 0)
+        end = min(start + min(limit, page_cap), total)
+        return {
+            "ok": True,
+            "members": list(range(start, end)),
+            "response_metadata": {"next_cursor": str(end) if end < total else ""},
+        }
+
+    return method, calls
+
+
+class TestCollectPages:
+    """Test cases for _collect_pages."""
+
+    def test_fills_limit_across_short_pages(self):
+        """Test that pages are followed until the limit is reached."""
+        method, calls = _fake_list_method(total=1000, page_cap=200)
+
+        items, next_cursor, error = asyncio.run(_collect_pages(method, "members", 500))
+
+        assert error is None
+        assert items == list(range(500))
+        assert next_cursor == "500"
+        assert [call["limit"] for call in calls] == [500, 300, 100]
+
+    def test_walks_all_pages_without_limit(self):
+        """Test that all pages are fetched when no limit is given."""
+        method, calls = _fake_list_method(total=450, page_cap=200)
+
+        items, next_cursor, error = asyncio.run(_collect_pages(method, "members"))
+
+        assert items == list(range(450))
+        assert next_cursor is None
+        assert len(calls) == 3
+
+    def test_starts_from_cursor_and_passes_kwargs(self):
+        """Test that the starting cursor and extra arguments are forwarded."""
+        method, calls = _fake_list_method(total=300)
+
+        items, _, _ = asyncio.run(
+            _collect_pages(method, "members", 50, "100", types="public_channel")
+        )
+
+        assert items == list(range(100, 150))
+        assert calls == [{"limit": 50, "cursor": "100", "types": "public_channel"}]
+
+    def test_returns_error_dict(self):
+        """Test that a failed page is returned as an error dict."""
+
+        async def method(**kwargs):
+            return {"ok": False, "error": "ratelimited"}
+
+        items, next_cursor, error = asyncio.run(_collect_pages(method, "members", 10))
+
+        assert items is None
+        assert next_cursor is None
+        assert error == {"ok": False, "error": "ratelimited"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,170 @@
+"""
+Tests for channel and user name resolution.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import slack_tools
+from slack_tools import _get_channel_index, _get_user_index, clear_list_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Start and finish every test with an empty cache."""
+    clear_list_cache()
+    yield
+    clear_list_cache()
+
+
+class _FakeClient:
+    """Fake Slack client with a single page of channels and users."""
+
+    def __init__(self):
+        self.conversations_list = AsyncMock(side_effect=self._conversations)
+        self.users_list = AsyncMock(
+            return_value={
+                "ok": True,
+                "members": [
+                    {"id": "U01ABCDEFGH", "name": "john", "profile": {"display_name": "Johnny"}},
+                    {"id": "U02ABCDEFGH", "name": "jane", "profile": {"display_name": ""}},
+                ],
+            }
+        )
+
+    async def _conversations(self, types, **kwargs):
+        channels = {
+            "public_channel": [{"id": "C01ABCDEFGH", "name": "general"}],
+            "private_channel": [{"id": "G01ABCDEFGH", "name": "secret"}],
+        }
+        return {"ok": True, "channels": channels[types]}
+
+
+class TestNameIndex:
+    """Test cases for the cached name indexes."""
+
+    def test_channel_index_covers_all_types(self):
+        """Test that public and private channels are both indexed."""
+        client = _FakeClient()
+
+        index = asyncio.run(_get_channel_index(client))
+
+        assert index == {"general": "C01ABCDEFGH", "secret": "G01ABCDEFGH"}
+
+    def test_channel_index_is_cached(self):
+        """Test that a second lookup doesn't call Slack again."""
+        client = _FakeClient()
+
+        asyncio.run(_get_channel_index(client))
+        asyncio.run(_get_channel_index(client))
+
+        assert client.conversations_list.await_count == 2
+
+    def test_user_index_includes_display_names(self):
+        """Test that users are indexed by username and display name."""
+        client = _FakeClient()
+
+        index = asyncio.run(_get_user_index(client))
+
+        assert index == {
+            "john": ("U01ABCDEFGH",),
+            "Johnny": ("U01ABCDEFGH",),
+            "jane": ("U02ABCDEFGH",),
+        }
+
+    def test_username_wins_over_display_name(self):
+        """Test that a display name never shadows another user's username."""
+        client = _FakeClient()
+        client.users_list.return_value = {
+            "ok": True,
+            "members": [
+                {"id": "U0AAAAAAAAA", "name": "alice", "profile": {"display_name": "jane"}},
+                {"id": "U0BBBBBBBBB", "name": "jane", "profile": {}},
+            ],
+        }
+
+        index = asyncio.run(_get_user_index(client))
+
+        assert index["jane"] == ("U0BBBBBBBBB",)
+        assert index["alice"] == ("U0AAAAAAAAA",)
+
+
+class TestResolve:
+    """Test cases for resolve_channel and resolve_user."""
+
+    def test_ids_are_returned_without_lookup(self):
+        """Test that values already in ID form skip authentication."""
+        with patch.object(slack_tools, "_get_authenticated_client") as mock_auth:
+            assert asyncio.run(slack_tools.resolve_channel("C01ABCDEFGH")) == {
+                "ok": True,
+                "channel_id": "C01ABCDEFGH",
+            }
+            assert asyncio.run(slack_tools.resolve_user("U01ABCDEFGH")) == {
+                "ok": True,
+                "user_id": "U01ABCDEFGH",
+            }
+            mock_auth.assert_not_called()
+
+    def test_names_are_resolved(self):
+        """Test that prefixed names are resolved through the index."""
+        client = _FakeClient()
+        auth = AsyncMock(return_value=(client, "U_CALLER", None))
+
+        with patch.object(slack_tools, "_get_authenticated_client", auth):
+            channel = asyncio.run(slack_tools.resolve_channel("#secret"))
+            user = asyncio.run(slack_tools.resolve_user("@Johnny"))
+
+        assert channel["channel_id"] == "G01ABCDEFGH"
+        assert user["user_id"] == "U01ABCDEFGH"
+
+    def test_ambiguous_display_name(self):
+        """Test that a display name shared by several users returns the candidates."""
+        client = _FakeClient()
+        client.users_list.return_value = {
+            "ok": True,
+            "members": [
+                {"id": "U0AAAAAAAAA", "name": "alice", "profile": {"display_name": "Al"}},
+                {"id": "U0BBBBBBBBB", "name": "albert", "profile": {"display_name": "Al"}},
+            ],
+        }
+        auth = AsyncMock(return_value=(client, "U_CALLER", None))
+
+        with patch.object(slack_tools, "_get_authenticated_client", auth):
+            result = asyncio.run(slack_tools.resolve_user("@Al"))
+
+        assert result == {
+            "ok": False,
+            "error": "User 'Al' is ambiguous",
+            "candidates": ["U0AAAAAAAAA", "U0BBBBBBBBB"],
+        }
+
+    def test_force_refresh_finds_new_user(self):
+        """Test that force_refresh rebuilds the user index before resolving."""
+        client = _FakeClient()
+        auth = AsyncMock(return_value=(client, "U_CALLER", None))
+
+        with patch.object(slack_tools, "_get_authenticated_client", auth):
+            assert asyncio.run(slack_tools.resolve_user("@newbie"))["ok"] is False
+
+            client.users_list.return_value = {
+                "ok": True,
+                "members": [{"id": "U03ABCDEFGH", "name": "newbie", "profile": {}}],
+            }
+            result = asyncio.run(slack_tools.resolve_user("@newbie", force_refresh=True))
+
+        assert result == {"ok": True, "user_id": "U03ABCDEFGH", "name": "newbie"}
+
+    def test_unknown_name(self):
+        """Test that unknown names return an error."""
+        client = _FakeClient()
+        auth = AsyncMock(return_value=(client, "U_CALLER", None))
+
+        with patch.object(slack_tools, "_get_authenticated_client", auth):
+            result = asyncio.run(slack_tools.resolve_channel("nope"))
+
+        assert result == {"ok": False, "error": "Channel 'nope' not found"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -5,7 +5,9 @@ Tests for search filter functionality.
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
-from slack_tools import _build_search_query, _parse_date, _parse_relative_date
+import pytest
+
+from slack_tools import _build_search_query, _parse_date, _parse_relative_date, _parse_types
 
 # Fixed datetime for testing to avoid race conditions
 FIXED_NOW = datetime(2025, 6, 15, 12, 0, 0)
@@ -70,6 +72,10 @@ class TestParseDate:
         result = _parse_date("2025-01-15")
         assert result == "2025-01-15"
 
+    def test_parse_unpadded_absolute_date(self):
+        """Test that month and day don't need zero padding."""
+        assert _parse_date("2025-1-5") == "2025-01-05"
+
     @patch("slack_tools.datetime")
     def test_parse_relative_date(self, mock_datetime):
         """Test parsing relative dates."""
@@ -83,6 +89,29 @@ class TestParseDate:
         assert _parse_date("not-a-date") is None
         assert _parse_date("2025-13-01") is None  # Invalid month
         assert _parse_date("2025-01-32") is None  # Invalid day
+        assert _parse_date("20250115") is None  # Compact ISO form
+        assert _parse_date("2025-W03-1") is None  # ISO week date
+
+
+class TestParseTypes:
+    """Test cases for channel types filter parsing."""
+
+    def test_split_and_strip(self):
+        """Test that types are split on commas and stripped."""
+        assert _parse_types("public_channel, private_channel") == (
+            "public_channel",
+            "private_channel",
+        )
+
+    def test_empty_types(self):
+        """Test that a missing filter parses to an empty tuple."""
+        assert _parse_types(None) == ()
+        assert _parse_types("") == ()
+
+    def test_invalid_type(self):
+        """Test that unknown channel types are rejected."""
+        with pytest.raises(ValueError, match="Invalid channel types: channels"):
+            _parse_types("public_channel,channels")
 
 
 class TestBuildSearchQuery:
@@ -0,0 +1,71 @@
+"""
+Tests for the Slack session middleware.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from auth import context
+from auth.session_middleware import SlackSessionMiddleware
+from auth.session_store import SlackSessionStore
+
+
+def _run(scope):
+    """Run the middleware for a single scope and return the context seen downstream."""
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen["session_id"] = context.fastmcp_session_id.get()
+        seen["user_id"] = context.authenticated_user_id.get()
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        pass
+
+    asyncio.run(SlackSessionMiddleware(app)(scope, receive, send))
+    return seen
+
+
+class TestSlackSessionMiddleware:
+    """Test cases for SlackSessionMiddleware."""
+
+    def test_sets_context_from_session_header(self):
+        """Test that the session header is resolved to the bound user."""
+        store = SlackSessionStore()
+        store.store_user_token("U_MIDDLEWARE", "token", session_id="mw_session")
+
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/mcp",
+            "headers": [(b"mcp-session-id", b"mw_session")],
+        }
+        with patch("auth.session_middleware.get_session_store", return_value=store):
+            seen = _run(scope)
+
+        assert seen == {"session_id": "mw_session", "user_id": "U_MIDDLEWARE"}
+
+    def test_skips_non_mcp_paths(self):
+        """Test that non-MCP paths pass through without session context."""
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": "/health",
+            "headers": [(b"mcp-session-id", b"mw_session")],
+        }
+        seen = _run(scope)
+
+        assert seen == {"session_id": None, "user_id": None}
+
+    def test_passes_through_lifespan_scope(self):
+        """Test that non-HTTP scopes are forwarded untouched."""
+        seen = _run({"type": "lifespan"})
+
+        assert seen == {"session_id": None, "user_id": None}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -106,6 +106,33 @@ class TestSessionSecurity:
         assert token1 == "token_a"
         assert token2 == "token_a"
 
+    def test_oauth_state_single_use(self):
+        """Test that a popped OAuth state cannot be replayed."""
+        store = SlackSessionStore()
+        state = store.generate_oauth_state("session_1")
+
+        popped = store.pop_oauth_state(state)
+        assert popped is not None
+        session_id, timestamp = popped
+        assert session_id == "session_1"
+        assert not store.is_oauth_state_expired(timestamp)
+
+        # Replaying the same state fails
+        assert store.pop_oauth_state(state) is None
+
+    def test_unknown_oauth_state(self):
+        """Test that states we never generated are rejected."""
+        store = SlackSessionStore()
+        assert store.pop_oauth_state("forged_state") is None
+
+    def test_expired_oauth_state(self):
+        """Test that states older than the expiry window are reported as expired."""
+        store = SlackSessionStore()
+        state = store.generate_oauth_state("session_1")
+        _, timestamp = store.pop_oauth_state(state)
+
+        assert store.is_oauth_state_expired(timestamp - store._state_expiry_seconds - 1)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])